@@ -0,0 +1,34 @@
+import numpy as np
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+
+def flatten_batch(T, X):
+    """Flatten batches of trajectories into a single axis of samples.
+
+    Args:
+        T: ndarray
+            (m, 1) or (m,) array of times, or any array that broadcasts
+            against the leading dimensions of X, such as (N, m, 1).
+        X: ndarray
+            (..., n) array of states, e.g. (m, n) for a single trajectory or
+            (N, m, n) for an ensemble of N trajectories.
+
+    Returns:
+        T_flat: ndarray
+            (M, 1) array of times, where M is the number of samples in X.
+        X_flat: ndarray
+            (M, n) array of states. A view of X whenever possible.
+    """
+    if X.ndim > 1 and np.size(T) == X.shape[-2]:
+        T = np.reshape(T, (-1, 1))
+    T_flat = np.broadcast_to(T, X.shape[:-1] + (1,)).reshape((-1, 1))
+    X_flat = X.reshape((-1, X.shape[-1]))
+
+    return T_flat, X_flat
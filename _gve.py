@@ -0,0 +1,48 @@
+import numpy as np
+from orbital_elements._jit import HAVE_NUMBA, njit, prange
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _apply_gve_kernel(G, a, out):
+    """Write the batched product of G and a into out."""
+    for i in prange(G.shape[0]):
+        for r in range(G.shape[1]):
+            s = 0.
+            for c in range(G.shape[2]):
+                s += G[i, r, c] * a[i, c]
+            out[i, r] = s
+
+
+def apply_gve(G, a, out=None):
+    """Apply GVE matrices to LVLH accelerations.
+
+    Args:
+        G: ndarray
+            (m, 6, 3) array of GVE matrices.
+        a: ndarray
+            (m, 3) array of accelerations in the LVLH frame.
+        out: ndarray, optional
+            (m, 6) array into which the state derivatives are written, such
+            as a view of the caller's result array. Allocated if not given.
+
+    Returns:
+        Xdot: ndarray
+            (m, 6) array of state derivatives.
+    """
+    if out is None:
+        out = np.empty(G.shape[0:2], dtype=np.result_type(G, a))
+
+    if HAVE_NUMBA:
+        _apply_gve_kernel(G, a, out)
+    else:
+        np.einsum('mij,mj->mi', G, a, out=out, casting='same_kind')
+
+    return out
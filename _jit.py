@@ -0,0 +1,35 @@
+"""Optional Numba support for compiled kernels.
+
+Numba is not required by orbital_elements. When it is installed, functions
+decorated with njit are compiled; otherwise njit leaves them as plain Python
+functions and callers fall back to their NumPy implementations by checking
+HAVE_NUMBA.
+"""
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+# fast-math flags short of assuming finite values, for kernels whose NaN and
+# inf results must match their NumPy counterparts
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
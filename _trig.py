@@ -0,0 +1,57 @@
+"""Tabulated sine and cosine for trig-heavy kernels on large ensembles.
+
+The functions here linearly interpolate a grid of N_GRID intervals over
+[0, 2*pi]. The absolute error is below (2*pi/N_GRID)**2/8, about 7e-8, which
+is well inside the error of the analytic perturbation models, but far from
+machine precision, so lookups are always opt-in.
+"""
+import numpy as np
+from orbital_elements._jit import njit
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+TWO_PI = 2*np.pi
+N_GRID = 8192
+
+_THETA = np.linspace(0., TWO_PI, N_GRID + 1)
+_SIN = np.sin(_THETA)
+_COS = np.cos(_THETA)
+_SCALE = N_GRID / TWO_PI
+
+
+@njit(cache=True)
+def sincos_lookup(angle):
+    """Interpolate the sine and cosine of a scalar angle from the grid."""
+    # NaN and inf have no grid index; propagate them like np.sin and np.cos
+    if not np.isfinite(angle):
+        return np.nan, np.nan
+    u = (angle % TWO_PI) * _SCALE
+    k = min(int(u), N_GRID - 1)
+    t = u - k
+    return (_SIN[k] + t*(_SIN[k+1] - _SIN[k]),
+            _COS[k] + t*(_COS[k+1] - _COS[k]))
+
+
+def sincos_interp(angle):
+    """Interpolate the sine and cosine of an array of angles from the grid.
+
+    NumPy counterpart of sincos_lookup, for use when Numba is not installed.
+
+    Args:
+        angle: ndarray
+            Array of angles in radians.
+
+    Returns:
+        s, c: tuple
+            Arrays shaped like angle holding the sines and cosines.
+    """
+    dtype = np.result_type(angle, 1.)
+    angle = np.mod(angle, TWO_PI)
+    return (np.interp(angle, _THETA, _SIN).astype(dtype, copy=False),
+            np.interp(angle, _THETA, _COS).astype(dtype, copy=False))
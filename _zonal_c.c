@@ -0,0 +1,70 @@
+/*
+ * Zonal gravity Hamiltonian for position-velocity states, J2 to J6.
+ *
+ * Optional C counterpart of the Numba kernel in rv/hamiltonian.py, loaded by
+ * _zonal_c.py through ctypes. Build it in the package directory with
+ *
+ *     cc -O3 -march=native -fno-math-errno -fno-trapping-math -fopenmp \
+ *         -fPIC -shared _zonal_c.c -o lib_zonal_c.so -lm
+ *
+ * (lib_zonal_c.dylib on macOS, lib_zonal_c.dll on Windows). Without
+ * -fopenmp the pragmas are ignored and the loop runs serially. Avoid
+ * -ffast-math: shared libraries linked with it switch the whole process to
+ * flush subnormals to zero when they are loaded.
+ *
+ * Author: Nathan I. Budd
+ * Copyright 2017, LASR Lab
+ * License: MIT
+ */
+#include <math.h>
+#include <stdint.h>
+
+/*
+ * Write the Hamiltonian of each of the m states in X to H.
+ *
+ * X   (m, 6) C-contiguous array of states ordered as (rx, ry, rz, vx, vy, vz)
+ * mu  Standard Gravitational Parameter
+ * r_e equatorial radius of Earth
+ * J   zonal coefficients J2 to J6
+ * n_J number of zonal terms to include, starting from J2
+ * m   number of states
+ * H   (m,) array of Hamiltonian values
+ */
+void zonal_hamiltonian_f64(const double *restrict X, double mu, double r_e,
+                           const double *restrict J, int n_J, int64_t m,
+                           double *restrict H)
+{
+    int64_t i;
+
+#pragma omp parallel for simd
+    for (i = 0; i < m; i++) {
+        const double *x = X + 6*i;
+        double inv_r = 1. / sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2]);
+        double s = x[2] * inv_r;
+        double s2 = s*s;
+        double ratio = r_e * inv_r;
+        double mu_by_r = mu * inv_r;
+
+        /* accumulate potential function terms, Legendre polynomials in
+         * Horner form, carrying the running power of (r_e/r) */
+        double V = -mu_by_r;
+        double ratio_k = ratio*ratio;
+        if (n_J >= 1)
+            V += J[0]/2. * mu_by_r * ratio_k * (3.*s2 - 1.);
+        ratio_k *= ratio;
+        if (n_J >= 2)
+            V += J[1]/2. * mu_by_r * ratio_k * (5.*s2 - 3.)*s;
+        ratio_k *= ratio;
+        if (n_J >= 3)
+            V += J[2]/8. * mu_by_r * ratio_k * ((35.*s2 - 30.)*s2 + 3.);
+        ratio_k *= ratio;
+        if (n_J >= 4)
+            V += J[3]/8. * mu_by_r * ratio_k * ((63.*s2 - 70.)*s2 + 15.)*s;
+        ratio_k *= ratio;
+        if (n_J >= 5)
+            V += J[4]/16. * mu_by_r * ratio_k * (
+                ((231.*s2 - 315.)*s2 + 105.)*s2 - 5.);
+
+        H[i] = .5 * (x[3]*x[3] + x[4]*x[4] + x[5]*x[5]) + V;
+    }
+}
@@ -0,0 +1,79 @@
+"""Optional C kernel for the zonal gravity Hamiltonian.
+
+The kernel in _zonal_c.c is not built automatically. When it has been
+compiled into lib_zonal_c.so (.dylib, .dll) next to this module, see the build
+command at the top of _zonal_c.c, rv.Hamiltonian evaluates double precision
+states with it; otherwise HAVE_ZONAL_C is False and rv.Hamiltonian uses its
+Numba or NumPy implementation.
+"""
+import ctypes
+import os
+
+import numpy as np
+from numpy.ctypeslib import ndpointer
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+
+def _load_library():
+    """Return the compiled kernel library, or None if it is not built."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for suffix in ('.so', '.dylib', '.dll'):
+        path = os.path.join(directory, 'lib_zonal_c' + suffix)
+        if os.path.exists(path):
+            try:
+                return ctypes.CDLL(path)
+            except OSError:
+                return None
+    return None
+
+
+_lib = _load_library()
+HAVE_ZONAL_C = _lib is not None
+
+if HAVE_ZONAL_C:
+    _zonal_hamiltonian_f64 = _lib.zonal_hamiltonian_f64
+    _zonal_hamiltonian_f64.restype = None
+    _zonal_hamiltonian_f64.argtypes = [
+        ndpointer(np.float64, ndim=2, flags='C_CONTIGUOUS'),
+        ctypes.c_double,
+        ctypes.c_double,
+        ndpointer(np.float64, ndim=1, flags='C_CONTIGUOUS'),
+        ctypes.c_int,
+        ctypes.c_int64,
+        ndpointer(np.float64, ndim=2, flags='C_CONTIGUOUS'),
+    ]
+
+
+def zonal_hamiltonian(X, mu, r_e, J, n_J):
+    """Evaluate the zonal gravity Hamiltonian with the C kernel.
+
+    Args:
+        X: ndarray
+            (m, 6) array of position-velocity states.
+        mu: float
+            Standard Gravitational Parameter.
+        r_e: float
+            Equatorial radius of Earth.
+        J: ndarray
+            5-element array of the zonal coefficients J2 to J6.
+        n_J: int
+            Number of zonal terms to include, starting from J2.
+
+    Returns:
+        H: ndarray
+            (m, 1) array of Hamiltonian values.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    J = np.ascontiguousarray(J, dtype=np.float64)
+    H = np.empty((X.shape[0], 1))
+    _zonal_hamiltonian_f64(X, float(mu), float(r_e), J, int(n_J),
+                           X.shape[0], H)
+
+    return H
@@ -0,0 +1,71 @@
+"""Array backends for evaluating dynamics on accelerators.
+
+The default backend is NumPy. CuPy and JAX are optional: they are imported
+only when requested, so orbital_elements does not depend on them. Arrays
+passed to dynamics using a non-NumPy backend should already live on that
+backend's device, and results stay there.
+
+JAX computes in single precision unless 64-bit mode is enabled, e.g. with
+jax.config.update("jax_enable_x64", True), before any arrays are created.
+"""
+import numpy as np
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+BACKENDS = ('numpy', 'cupy', 'jax')
+
+
+def get_array_module(backend='numpy'):
+    """Return the NumPy-compatible array module of a backend.
+
+    Args:
+        backend: str, optional
+            One of 'numpy', 'cupy', or 'jax'. Defaults to 'numpy'.
+
+    Returns:
+        xp: module
+            numpy, cupy, or jax.numpy.
+
+    Raises:
+        ValueError: If backend is not one of BACKENDS.
+        ImportError: If the backend's package is not installed.
+    """
+    if backend == 'numpy':
+        return np
+    elif backend == 'cupy':
+        import cupy
+        return cupy
+    elif backend == 'jax':
+        import jax.numpy
+        return jax.numpy
+    raise ValueError('backend must be one of {}, not {!r}'.format(
+        BACKENDS, backend))
+
+
+def compile_rhs(backend, func):
+    """Compile a function of arrays for a backend, where it pays off.
+
+    Functions are wrapped in jax.jit for the JAX backend, so XLA fuses the
+    whole right-hand side into a few kernels, and returned unchanged
+    otherwise.
+
+    Args:
+        backend: str
+            One of 'numpy', 'cupy', or 'jax'.
+        func: callable
+            Function taking and returning arrays of the backend.
+
+    Returns:
+        func: callable
+            The compiled or unchanged function.
+    """
+    if backend == 'jax':
+        import jax
+        return jax.jit(func)
+    return func
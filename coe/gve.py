@@ -1,4 +1,6 @@
 import numpy as np
+from orbital_elements._jit import FASTMATH, HAVE_NUMBA, njit, prange
+from orbital_elements._trig import sincos_lookup, sincos_interp
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -9,6 +11,43 @@ __status__ = "Production"
 __date__ = "04 Mar 2017"
 
 
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def _gve_lookup_kernel(X, mu, G):
+    """Write GVE matrices into G, taking trig functions from the grid."""
+    for j in prange(X.shape[0]):
+        a = X[j, 0]
+        e = X[j, 1]
+        i = X[j, 2]
+        w = X[j, 4]
+        f = X[j, 5]
+
+        sf, cf = sincos_lookup(f)
+        st, ct = sincos_lookup(f + w)
+        si, ci = sincos_lookup(i)
+        p = a * (1. - e*e)
+        r = p / (1. + e*cf)
+        h = (mu * p)**.5
+
+        G[j, 0, 0] = e*sf * 2*a*a/h
+        G[j, 0, 1] = p/r * 2*a*a/h
+        G[j, 0, 2] = 0.
+        G[j, 1, 0] = p*sf / h
+        G[j, 1, 1] = ((p+r)*cf + r*e) / h
+        G[j, 1, 2] = 0.
+        G[j, 2, 0] = 0.
+        G[j, 2, 1] = 0.
+        G[j, 2, 2] = r*ct/h
+        G[j, 3, 0] = 0.
+        G[j, 3, 1] = 0.
+        G[j, 3, 2] = r*st/h/si
+        G[j, 4, 0] = -p*cf/e / h
+        G[j, 4, 1] = (p+r)*sf/e / h
+        G[j, 4, 2] = -r*st*ci/si / h
+        G[j, 5, 0] = p*cf / h / e
+        G[j, 5, 1] = -(p+r)*sf / h / e
+        G[j, 5, 2] = 0.
+
+
 class GVE(object):
     """Gauss's Variational Equations for classical orbital elements.
 
@@ -16,10 +55,15 @@ class GVE(object):
         mu: float, optional
             Standard Gravitational Parameter. Defaults to 1.0, the standard
             value in canonical units.
+        trig_lookup: bool, optional
+            Interpolate sines and cosines from a precomputed grid instead of
+            evaluating them, trading accuracy (about 1e-7) for speed on large
+            ensembles. Defaults to False.
     """
 
-    def __init__(self, mu=1.0):
+    def __init__(self, mu=1.0, trig_lookup=False):
         self.mu = mu
+        self.trig_lookup = trig_lookup
 
     def __call__(self, T, X):
         """Calculate GVE matrices for classical orbital elements.
@@ -40,6 +84,12 @@ class GVE(object):
             G: ndarray
                 (m, 6, 3) array of GVE matrices.
         """
+        if self.trig_lookup and HAVE_NUMBA:
+            X = np.ascontiguousarray(X)
+            G = np.empty((X.shape[0], 6, 3), dtype=np.result_type(X, 1.))
+            _gve_lookup_kernel(X, float(self.mu), G)
+            return G
+
         dims = (T.shape[0], 1, 1)
 
         a = X[:, 0:1].reshape(dims)
@@ -48,16 +98,21 @@ class GVE(object):
         w = X[:, 4:5].reshape(dims)
         f = X[:, 5:6].reshape(dims)
 
-        sf = np.sin(f)
-        cf = np.cos(f)
-        st = np.sin(f + w)
-        ct = np.cos(f + w)
-        si = np.sin(i)
-        ci = np.cos(i)
+        if self.trig_lookup:
+            sf, cf = sincos_interp(f)
+            st, ct = sincos_interp(f + w)
+            si, ci = sincos_interp(i)
+        else:
+            sf = np.sin(f)
+            cf = np.cos(f)
+            st = np.sin(f + w)
+            ct = np.cos(f + w)
+            si = np.sin(i)
+            ci = np.cos(i)
         p = a * (1. - e**2)
         r = p / (1. + e*cf)
         h = (self.mu * p)**.5
-        zero = np.zeros(dims)
+        zero = np.zeros(dims, dtype=X.dtype)
 
         adot = np.concatenate((e*sf, p/r, zero), axis=2) * 2*a**2/h
         edot = np.concatenate((p*sf, (p+r)*cf + r*e, zero), axis=2) / h
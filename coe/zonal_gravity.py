@@ -1,5 +1,12 @@
+from functools import partial
+
+import numpy as np
 import orbital_elements.convert as convert
+from orbital_elements._batch import flatten_batch
+from orbital_elements._gve import apply_gve
+from orbital_elements.backend import compile_rhs, get_array_module
 from orbital_elements.coe.gve import GVE
+from orbital_elements.rv.hamiltonian import J2_to_6
 from orbital_elements.rv.zonal_gravity import ZonalGravity as rvZonalGravity
 
 
@@ -12,13 +19,104 @@ __status__ = "Production"
 __date__ = "16 Mar 2017"
 
 
+def _zonal_gravity_xp(xp, T, X, mu, J, r_earth):
+    """Zonal gravity COE derivatives written against the array module xp.
+
+    Column-form counterpart of ZonalGravity.__call__ for the CuPy and JAX
+    backends. It updates no arrays in place, so jax.jit can trace it. The
+    zonal acceleration of each J term is split as A*i_r + B*i_z, with i_z the
+    ECI 3-axis, which rotates into the LVLH frame without building the
+    position-velocity state.
+    """
+    a, e, i, W, w, f = (X[..., k] for k in range(6))
+
+    sf = xp.sin(f)
+    cf = xp.cos(f)
+    st = xp.sin(f + w)
+    ct = xp.cos(f + w)
+    si = xp.sin(i)
+    ci = xp.cos(i)
+    p = a * (1. - e**2)
+    r = p / (1. + e*cf)
+    h = (mu * p)**.5
+
+    z = st * si
+    z2 = z**2
+    mu_by_r2 = mu / r**2
+    re_by_r = r_earth / r
+
+    A = xp.zeros_like(r)
+    B = xp.zeros_like(r)
+    if len(J) > 0:
+        c = -3./2. * J[0] * mu_by_r2 * re_by_r**2
+        A = A + c * (1. - 5.*z2)
+        B = B + c * 2.*z
+    if len(J) > 1:
+        c = 1./2. * J[1] * mu_by_r2 * re_by_r**3
+        A = A + c * 5.*(7.*z2 - 3.)*z
+        B = B + c * (3. - 15.*z2)
+    if len(J) > 2:
+        c = 5./8. * J[2] * mu_by_r2 * re_by_r**4
+        A = A + c * (3. - 42.*z2 + 63.*z2**2)
+        B = B + c * (12. - 28.*z2)*z
+    if len(J) > 3:
+        c = 1./8. * J[3] * mu_by_r2 * re_by_r**5
+        A = A + c * (105. - 630.*z2 + 693.*z2**2)*z
+        B = B + c * (-15. + 210.*z2 - 315.*z2**2)
+    if len(J) > 4:
+        c = -1./16. * J[4] * mu_by_r2 * re_by_r**6
+        A = A + c * (35. - 945.*z2 + 3465.*z2**2 - 3003.*z2**3)
+        B = B + c * (210. - 1260.*z2 + 1386.*z2**2)*z
+
+    # i_z has components (sin(w+f)*sin(i), cos(w+f)*sin(i), cos(i)) in LVLH
+    a_r = A + B*z
+    a_t = B * ct*si
+    a_h = B * ci
+
+    return xp.stack((
+        2.*a**2/h * (e*sf*a_r + p/r*a_t),
+        (p*sf*a_r + ((p+r)*cf + r*e)*a_t) / h,
+        r*ct/h * a_h,
+        r*st/h/si * a_h,
+        (-p*cf/e*a_r + (p+r)*sf/e*a_t - r*st*ci/si*a_h) / h,
+        (p*cf*a_r - (p+r)*sf*a_t) / h / e,
+    ), axis=-1)
+
+
 class ZonalGravity(rvZonalGravity):
-    """Zonal gravity dynamics for classical orbital elements."""
+    """Zonal gravity dynamics for classical orbital elements.
+
+    Attributes:
+        memoize: bool, optional
+            If True, a call with the same (T, X) as the previous call, as made
+            by first-same-as-last integrators, returns the previous state
+            derivatives without recomputing them. Defaults to False.
+        dtype: data-type, optional
+            Floating point type of states and results. Defaults to
+            np.float64.
+        backend: str, optional
+            Array backend, one of 'numpy', 'cupy', or 'jax'. Defaults to
+            'numpy'. Other backends take and return arrays on their own
+            device, do not memoize, and leave a_eci and a_lvlh unset.
+        trig_lookup: bool, optional
+            Evaluate the GVE with tabulated sines and cosines, as in
+            coe.GVE. NumPy backend only. Defaults to False.
+    """
 
-    def __init__(self, mu=1.0, order=2, r_earth=1.0):
+    def __init__(self, mu=1.0, order=2, r_earth=1.0, memoize=False,
+                 dtype=np.float64, backend='numpy', trig_lookup=False):
         super().__init__(mu=mu, order=order, r_earth=r_earth)
+        self.dtype = np.dtype(dtype)
+        self.memoize = memoize
+        self._memo = None
+        self._gve = GVE(mu=mu, trig_lookup=trig_lookup)
+        self.backend = backend
+        self.xp = get_array_module(backend)
+        self._rhs = compile_rhs(backend, partial(
+            _zonal_gravity_xp, self.xp, mu=mu,
+            J=J2_to_6[0:max(0, order-1)], r_earth=r_earth))
 
-    def __call__(self, T, X):
+    def __call__(self, T, X, return_aux=False):
         """Calculate zonal gravity perturations in classical orbital elements.
 
         Args:
@@ -32,13 +130,48 @@ class ZonalGravity(rvZonalGravity):
                 W = right ascension of the ascending node
                 w = argument of perigee
                 f = true anomaly
+                An (N, m, 6) ensemble of N trajectories is also accepted.
+            return_aux: bool, optional
+                If True, return the perturbing accelerations alongside the
+                state derivatives instead of setting a_eci and a_lvlh.
+                Defaults to False.
 
         Returns:
             Xdot: ndarray
-                (m, 6) array of state derivatives.
+                (m, 6) array of state derivatives, or (N, m, 6) for an
+                ensemble.
+            aux: dict
+                Only if return_aux is True. Holds the (m, 3) arrays a_eci and
+                a_lvlh, with N*m rows for an ensemble, or nothing for
+                backends other than NumPy.
         """
-        super().lvlh_acceleration(T, convert.rv_coe(X))
-        G = GVE()(T, X)
-        m = T.shape[0]
+        if self.backend != 'numpy':
+            Xdot = self._rhs(T, self.xp.asarray(X, dtype=self.dtype))
+            return (Xdot, {}) if return_aux else Xdot
+
+        X = np.asarray(X, dtype=self.dtype)
+        memo = self._memo
+        if (self.memoize and memo is not None and
+                np.array_equal(memo[0], T) and np.array_equal(memo[1], X)):
+            Xdot = memo[2].copy()
+            aux = {key: value.copy() for key, value in memo[3].items()}
+        else:
+            shape = X.shape
+            T_flat, X_flat = flatten_batch(np.asarray(T, dtype=self.dtype), X)
+            a_eci, a_lvlh = self._lvlh_acceleration(T_flat,
+                                                    convert.rv_coe(X_flat))
+            G = self._gve(T_flat, X_flat)
+            Xdot = np.empty(shape, dtype=self.dtype)
+            apply_gve(G, a_lvlh, out=Xdot.reshape((-1, 6)))
+            aux = {'a_eci': a_eci, 'a_lvlh': a_lvlh}
+
+            if self.memoize:
+                self._memo = (np.array(T), np.array(X), Xdot.copy(),
+                              {key: value.copy()
+                               for key, value in aux.items()})
+
+        if return_aux:
+            return Xdot, aux
+        self.a_eci, self.a_lvlh = aux['a_eci'], aux['a_lvlh']
 
-        return (G @ self.a_lvlh.reshape((m, 3, 1))).reshape((m, 6))
+        return Xdot
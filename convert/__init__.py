@@ -23,3 +23,4 @@ from .meeMl0_coe import meeMl0_coe
 from .coe_meeMl0 import coe_meeMl0
 from .meeMl0_rv import meeMl0_rv
 from .rv_meeMl0 import rv_meeMl0
+from .soa import to_soa, from_soa
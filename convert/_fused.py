@@ -0,0 +1,180 @@
+import numpy as np
+from orbital_elements._jit import FASTMATH, njit, prange
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+# Single-pass kernels for the conversions that pass through MEEs on their way
+# to or from MEEs with mean longitude at epoch. Each row is carried through
+# both stages in scalar locals, so no (m, 6) intermediate MEE array is built.
+# The algebra mirrors mee_coe, mee_rv, rv_mee, meeMl0_mee and mee_meeMl0.
+
+TWO_PI = 2*np.pi
+
+
+@njit(fastmath=FASTMATH, error_model='numpy', cache=True)
+def _Ml_fl(f, g, fl):
+    """Mean longitude from true longitude (meeMl_meefl)."""
+    e = (f*f + g*g)**.5
+    B = ((1. + e) / (1. - e))**.5
+    tan_wbar_by_2 = ((e - f) / (e + f))**.5
+    tan_fl_by_2 = np.tan(fl/2.)
+    tan_E_by_2 = 1./B * ((tan_fl_by_2 - tan_wbar_by_2) /
+                         (1. + tan_fl_by_2 * tan_wbar_by_2))
+    tan_El_by_2 = ((tan_E_by_2 + tan_wbar_by_2) /
+                   (1. - tan_E_by_2 * tan_wbar_by_2))
+    El = (2.*np.arctan(tan_El_by_2)) % TWO_PI
+
+    return (El - f*np.sin(El) + g*np.cos(El)) % TWO_PI
+
+
+@njit(fastmath=FASTMATH, error_model='numpy', cache=True)
+def _fl_Ml(f, g, Ml, tol=1e-14, max_iterations=15):
+    """True longitude from mean longitude (meefl_meeMl)."""
+    # Kepler's equation in eccentric longitude, solved by Newton's method
+    # starting from the equinoctial form of E0 = M + e*sign(sin(M))
+    El = Ml + np.sign(f*np.sin(Ml) - g*np.cos(Ml))*(f*f + g*g)**.5
+    for _ in range(max_iterations + 1):
+        dEl = ((Ml - El + f*np.sin(El) - g*np.cos(El)) /
+               (-1. + f*np.cos(El) + g*np.sin(El)))
+        El -= dEl
+        if abs(dEl) <= tol:
+            break
+    El = El % TWO_PI
+
+    e = (f*f + g*g)**.5
+    B = ((1. + e) / (1. - e))**.5
+    tan_wbar_by_2 = ((e - f) / (e + f))**.5
+    tan_El_by_2 = np.tan(El/2.)
+    tan_f_by_2 = B * ((tan_El_by_2 - tan_wbar_by_2) /
+                      (1. + tan_El_by_2 * tan_wbar_by_2))
+    tan_fl_by_2 = ((tan_f_by_2 + tan_wbar_by_2) /
+                   (1. - tan_f_by_2 * tan_wbar_by_2))
+
+    return (2.*np.arctan(tan_fl_by_2)) % TWO_PI
+
+
+@njit(parallel=True, fastmath=FASTMATH, error_model='numpy', cache=True)
+def _coe_to_meeMl0(T, coe, mu, out):
+    """Write MEEs with Ml0 converted from COEs into out (meeMl0_coe)."""
+    for j in prange(coe.shape[0]):
+        a = coe[j, 0]
+        e = coe[j, 1]
+        i = coe[j, 2]
+        W = coe[j, 3]
+        w = coe[j, 4]
+        nu = coe[j, 5]
+
+        p = a * (1. - e*e)
+        f = e * np.cos(w + W)
+        g = e * np.sin(w + W)
+        tan_i_by_2 = np.tan(i/2.)
+        h = tan_i_by_2 * np.cos(W)
+        k = tan_i_by_2 * np.sin(W)
+        L = (W + w + nu) % TWO_PI
+
+        Ml = _Ml_fl(f, g, L)
+        a_mee = p / (1. - f*f - g*g)
+        n = (mu / a_mee**3)**.5
+
+        out[j, 0] = p
+        out[j, 1] = f
+        out[j, 2] = g
+        out[j, 3] = h
+        out[j, 4] = k
+        out[j, 5] = Ml - n*T[j]
+
+
+@njit(parallel=True, fastmath=FASTMATH, error_model='numpy', cache=True)
+def _rv_to_meeMl0(T, rv, mu, out):
+    """Write MEEs with Ml0 converted from RV into out (meeMl0_rv)."""
+    for j in prange(rv.shape[0]):
+        rx, ry, rz = rv[j, 0], rv[j, 1], rv[j, 2]
+        vx, vy, vz = rv[j, 3], rv[j, 4], rv[j, 5]
+        r_norm = (rx*rx + ry*ry + rz*rz)**.5
+
+        # angular momentum
+        Hx = ry*vz - rz*vy
+        Hy = rz*vx - rx*vz
+        Hz = rx*vy - ry*vx
+        H_norm = (Hx*Hx + Hy*Hy + Hz*Hz)**.5
+
+        p = H_norm*H_norm / mu
+        h = -Hy/H_norm / (1. + Hz/H_norm)
+        k = Hx/H_norm / (1. + Hz/H_norm)
+
+        # equinoctial 1,2-unit vectors in ECI frame
+        h2 = h*h
+        k2 = k*k
+        s = 1. + h2 + k2
+        fx, fy, fz = (1. + h2 - k2)/s, 2.*h*k/s, -2.*k/s
+        gx, gy, gz = 2.*h*k/s, (1. - h2 + k2)/s, 2.*h/s
+
+        # eccentricity vector
+        ex = (vy*Hz - vz*Hy)/mu - rx/r_norm
+        ey = (vz*Hx - vx*Hz)/mu - ry/r_norm
+        ez = (vx*Hy - vy*Hx)/mu - rz/r_norm
+
+        f = ex*fx + ey*fy + ez*fz
+        g = ex*gx + ey*gy + ez*gz
+        L = np.arctan2(rx*gx + ry*gy + rz*gz, rx*fx + ry*fy + rz*fz) % TWO_PI
+
+        Ml = _Ml_fl(f, g, L)
+        a_mee = p / (1. - f*f - g*g)
+        n = (mu / a_mee**3)**.5
+
+        out[j, 0] = p
+        out[j, 1] = f
+        out[j, 2] = g
+        out[j, 3] = h
+        out[j, 4] = k
+        out[j, 5] = Ml - n*T[j]
+
+
+@njit(parallel=True, fastmath=FASTMATH, error_model='numpy', cache=True)
+def _meeMl0_to_rv(T, meeMl0, mu, out):
+    """Write RV converted from MEEs with Ml0 into out (rv_meeMl0)."""
+    for j in prange(meeMl0.shape[0]):
+        p = meeMl0[j, 0]
+        f = meeMl0[j, 1]
+        g = meeMl0[j, 2]
+        h = meeMl0[j, 3]
+        k = meeMl0[j, 4]
+
+        a_mee = p / (1. - f*f - g*g)
+        n = (mu / a_mee**3)**.5
+        L = _fl_Ml(f, g, meeMl0[j, 5] + n*T[j])
+
+        cL = np.cos(L)
+        sL = np.sin(L)
+        w = 1. + f*cL + g*sL
+        r = p / w
+
+        # r and v in equinoctial frame
+        x = r*cL
+        y = r*sL
+        sqrt_mu_by_p = (mu/p)**.5
+        r_dot = sqrt_mu_by_p * (f*sL - g*cL)
+        rL_dot = sqrt_mu_by_p * w
+        vx = r_dot*cL - rL_dot*sL
+        vy = r_dot*sL + rL_dot*cL
+
+        # rotate from equinoctial to ECI frame
+        h2 = h*h
+        k2 = k*k
+        s = 1. + h2 + k2
+        D00, D01 = (1. + h2 - k2)/s, 2.*h*k/s
+        D10, D11 = 2.*h*k/s, (1. - h2 + k2)/s
+        D20, D21 = -2.*k/s, 2.*h/s
+
+        out[j, 0] = D00*x + D01*y
+        out[j, 1] = D10*x + D11*y
+        out[j, 2] = D20*x + D21*y
+        out[j, 3] = D00*vx + D01*vy
+        out[j, 4] = D10*vx + D11*vy
+        out[j, 5] = D20*vx + D21*vy
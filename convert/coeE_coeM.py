@@ -36,22 +36,25 @@ def coeE_coeM(coeM, tol=1e-14):
             w = argument of perigee
             E = eccentric anomaly
     """
-    e = coeM[0:, 1:2]
-    M = coeM[0:, 5:6]
-    E0 = M + np.sign(np.sin(M))*e
-    E1 = E0 + 1.
     max_iterations = 30
-    iter_num = 0
 
-    while np.max(np.absolute(E1 - E0)) > tol:
-        E0 = E1
-        E1 = E0 + (M - E0 + e*np.sin(E0)) / (1. - e*np.cos(E0))
-        iter_num += 1
-        if iter_num > max_iterations:
-            print(
-                'max ({}) iterations reached in coeE_coeM. Error: {}'.format(
-                    max_iterations, np.max(np.absolute(E1 - E0))))
+    # Newton's method on all rows at once, dropping rows as they converge
+    e = coeM[0:, 1]
+    M = coeM[0:, 5]
+    E = M + np.sign(np.sin(M))*e
+    rows = np.arange(E.shape[0])
+    for _ in range(max_iterations + 1):
+        e_, M_, E_ = e[rows], M[rows], E[rows]
+        dE = (M_ - E_ + e_*np.sin(E_)) / (1. - e_*np.cos(E_))
+        E[rows] = E_ + dE
+        unconverged = np.absolute(dE) > tol
+        if not unconverged.any():
             break
+        rows = rows[unconverged]
+    else:
+        print(
+            'max ({}) iterations reached in coeE_coeM. Error: {}'.format(
+                max_iterations, np.max(np.absolute(dE))))
 
     return np.concatenate(
-        (coeM[0:, 0:5], np.mod(E1, 2*np.pi)), axis=1)
+        (coeM[0:, 0:5], np.mod(E, 2*np.pi).reshape((-1, 1))), axis=1)
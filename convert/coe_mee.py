@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -34,12 +35,23 @@ def coe_mee(mee):
             w = argument of perigee
             nu = true anomaly
     """
-    p = mee[0:, 0:1]
-    f = mee[0:, 1:2]
-    g = mee[0:, 2:3]
-    h = mee[0:, 3:4]
-    k = mee[0:, 4:5]
-    L = mee[0:, 5:6]
+    return from_soa(coe_mee_soa(to_soa(mee)))
+
+
+def coe_mee_soa(mee):
+    """Column-wise form of coe_mee.
+
+    See coe_mee for the definitions of the elements.
+
+    Args:
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+
+    Returns:
+        coe: tuple
+            (a, e, i, W, w, nu) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, L = mee
 
     # inclination
     i = np.mod(2. * np.arctan((h**2 + k**2)**.5), 2*np.pi)
@@ -58,6 +70,6 @@ def coe_mee(mee):
     w = np.mod(w_bar - W, 2*np.pi)
 
     # true anomaly
-    f = np.mod(L - w_bar, 2*np.pi)
+    nu = np.mod(L - w_bar, 2*np.pi)
 
-    return np.concatenate((a, e, i, W, w, f), axis=1)
+    return a, e, i, W, w, nu
@@ -1,5 +1,6 @@
-from .coe_mee import coe_mee
-from .mee_meeMl0 import mee_meeMl0
+from .soa import to_soa, from_soa
+from .coe_mee import coe_mee_soa
+from .mee_meeMl0 import mee_meeMl0_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -40,4 +41,23 @@ def coe_meeMl0(T, meeMl0, mu=1.0):
             w = argument of perigee
             nu = true anomaly
     """
-    return coe_mee(mee_meeMl0(T, meeMl0))
+    return from_soa(coe_meeMl0_soa(T, to_soa(meeMl0), mu=mu))
+
+
+def coe_meeMl0_soa(T, meeMl0, mu=1.0):
+    """Column-wise form of coe_meeMl0.
+
+    See coe_meeMl0 for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        T: ndarray
+            (m, 1) array of times.
+        meeMl0: tuple
+            (p, f, g, h, k, Ml0) tuple of (m,) arrays.
+
+    Returns:
+        coe: tuple
+            (a, e, i, W, w, nu) tuple of (m,) arrays.
+    """
+    return coe_mee_soa(mee_meeMl0_soa(T, meeMl0, mu=mu))
@@ -1,5 +1,6 @@
-from .mee_rv import mee_rv
-from .coe_mee import coe_mee
+from .soa import to_soa, from_soa
+from .mee_rv import mee_rv_soa
+from .coe_mee import coe_mee_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -36,4 +37,20 @@ def coe_rv(rv):
             w = argument of perigee
             nu = true anomaly
     """
-    return coe_mee(mee_rv(rv))
+    return from_soa(coe_rv_soa(to_soa(rv)))
+
+
+def coe_rv_soa(rv):
+    """Column-wise form of coe_rv.
+
+    See coe_rv for the definitions of the elements.
+
+    Args:
+        rv: tuple
+            (rx, ry, rz, vx, vy, vz) tuple of (m,) arrays.
+
+    Returns:
+        coe: tuple
+            (a, e, i, W, w, nu) tuple of (m,) arrays.
+    """
+    return coe_mee_soa(mee_rv_soa(rv))
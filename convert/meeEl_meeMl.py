@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -23,7 +24,8 @@ def meeEl_meeMl(meeMl, tol=1e-14):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml = mean longitude
         tol: float, optional
-            Tolerance for checking convergence of Newton's method.
+            Tolerance for checking convergence of Newton's method. Raised to
+            the spacing of angles near 2*pi for states in single precision.
 
     Returns:
         meeEl: ndarray
@@ -36,24 +38,43 @@ def meeEl_meeMl(meeMl, tol=1e-14):
             k = 2-component of the ascending node vector in equinoctial frame
             El = eccentric longitude
     """
-    f = meeMl[:, 1:2]
-    g = meeMl[:, 2:3]
-    Ml = meeMl[:, 5:6]
-    El0 = Ml + np.sign(np.sin(Ml))*(f**2 + g**2)**0.5
-    El1 = El0 + 1.
+    return from_soa(meeEl_meeMl_soa(to_soa(meeMl), tol=tol))
+
+
+def meeEl_meeMl_soa(meeMl, tol=1e-14):
+    """Column-wise form of meeEl_meeMl.
+
+    See meeEl_meeMl for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        meeMl: tuple
+            (p, f, g, h, k, Ml) tuple of (m,) arrays.
+
+    Returns:
+        meeEl: tuple
+            (p, f, g, h, k, El) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, Ml = meeMl
+    tol = max(tol, 4*np.pi*np.finfo(np.result_type(Ml, 1.)).eps)
     max_iterations = 15
-    iter_num = 0
-
-    while np.max(np.absolute(El1 - El0)) > tol:
-        El0 = El1
-        El1 = (El0 - (Ml - El0 + f*np.sin(El0) - g*np.cos(El0)) /
-               (-1. + f*np.cos(El0) + g*np.sin(El0)))
-        iter_num += 1
-        if iter_num > max_iterations:
-            print(
-                'max ({}) iterations reached in meeEl_meeMl. Error: {}'.format(
-                    max_iterations, np.max(np.absolute(El1 - El0))))
+
+    # Newton's method on all rows at once, dropping rows as they converge
+    fb, gb, Mlb = np.broadcast_arrays(f, g, Ml)
+    El = Mlb + np.sign(fb*np.sin(Mlb) - gb*np.cos(Mlb))*(fb**2 + gb**2)**0.5
+    rows = np.arange(El.shape[0])
+    for _ in range(max_iterations + 1):
+        f_, g_, Ml_, El_ = fb[rows], gb[rows], Mlb[rows], El[rows]
+        dEl = ((Ml_ - El_ + f_*np.sin(El_) - g_*np.cos(El_)) /
+               (-1. + f_*np.cos(El_) + g_*np.sin(El_)))
+        El[rows] = El_ - dEl
+        unconverged = np.absolute(dEl) > tol
+        if not unconverged.any():
             break
+        rows = rows[unconverged]
+    else:
+        print(
+            'max ({}) iterations reached in meeEl_meeMl. Error: {}'.format(
+                max_iterations, np.max(np.absolute(dEl))))
 
-    return np.concatenate(
-        (meeMl[0:, 0:5], np.mod(El1, 2*np.pi)), axis=1)
+    return p, f, g, h, k, np.mod(El, 2*np.pi)
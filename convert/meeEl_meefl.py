@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -34,9 +35,23 @@ def meeEl_meefl(meefl):
             k = 2-component of the ascending node vector in equinoctial frame
             El = eccentric longitude
     """
-    f = meefl[:, 1:2]
-    g = meefl[:, 2:3]
-    fl = meefl[:, 5:6]
+    return from_soa(meeEl_meefl_soa(to_soa(meefl)))
+
+
+def meeEl_meefl_soa(meefl):
+    """Column-wise form of meeEl_meefl.
+
+    See meeEl_meefl for the definitions of the elements.
+
+    Args:
+        meefl: tuple
+            (p, f, g, h, k, fl) tuple of (m,) arrays.
+
+    Returns:
+        meeEl: tuple
+            (p, f, g, h, k, El) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, fl = meefl
 
     e = (f**2 + g**2)**.5
     B = ((1 + e) / (1 - e))**.5
@@ -48,4 +63,4 @@ def meeEl_meefl(meefl):
                    (1 - tan_E_by_2 * tan_wbar_by_2))
     El = np.mod((2*np.arctan(tan_El_by_2)), 2*np.pi)
 
-    return np.concatenate((meefl[:, 0:5], El), axis=1)
+    return p, f, g, h, k, El
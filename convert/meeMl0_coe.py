@@ -1,5 +1,9 @@
-from .meeMl0_mee import meeMl0_mee
-from .mee_coe import mee_coe
+import numpy as np
+from orbital_elements._jit import HAVE_NUMBA
+from .soa import to_soa, from_soa
+from .meeMl0_mee import meeMl0_mee_soa
+from .mee_coe import mee_coe_soa
+from ._fused import _coe_to_meeMl0
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -40,4 +44,11 @@ def meeMl0_coe(T, coe, mu=1.0):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml0 = mean longitude at epoch
     """
-    return meeMl0_mee(T, mee_coe(coe))
+    if HAVE_NUMBA and np.size(T) == coe.shape[0]:
+        T = np.ascontiguousarray(np.ravel(T), dtype=np.float64)
+        coe = np.ascontiguousarray(coe, dtype=np.float64)
+        out = np.empty(coe.shape)
+        _coe_to_meeMl0(T, coe, float(mu), out)
+        return out
+
+    return from_soa(meeMl0_mee_soa(T, mee_coe_soa(to_soa(coe)), mu=mu))
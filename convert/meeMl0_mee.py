@@ -1,5 +1,6 @@
 import numpy as np
-from .meeMl_meefl import meeMl_meefl
+from .soa import to_soa, from_soa
+from .meeMl_meefl import meeMl_meefl_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -40,14 +41,29 @@ def meeMl0_mee(T, mee, mu=1.0):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml0 = mean longitude at epoch
     """
-    meeMl = meeMl_meefl(mee)
-    p = meeMl[:, 0:1]
-    f = meeMl[:, 1:2]
-    g = meeMl[:, 2:3]
-    Ml = meeMl[:, 5:6]
+    return from_soa(meeMl0_mee_soa(T, to_soa(mee), mu=mu))
+
+
+def meeMl0_mee_soa(T, mee, mu=1.0):
+    """Column-wise form of meeMl0_mee.
+
+    See meeMl0_mee for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        T: ndarray
+            (m, 1) array of times.
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+
+    Returns:
+        meeMl0: tuple
+            (p, f, g, h, k, Ml0) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, Ml = meeMl_meefl_soa(mee)
 
     a = p / (1 - f**2 - g**2)
     n = (mu / a**3)**0.5
-    Ml0 = Ml - n*T
+    Ml0 = Ml - n*np.ravel(T)
 
-    return np.concatenate((mee[:, 0:5], Ml0), axis=1)
+    return p, f, g, h, k, Ml0
@@ -1,5 +1,9 @@
-from .meeMl0_mee import meeMl0_mee
-from .mee_rv import mee_rv
+import numpy as np
+from orbital_elements._jit import HAVE_NUMBA
+from .soa import to_soa, from_soa
+from .meeMl0_mee import meeMl0_mee_soa
+from .mee_rv import mee_rv_soa
+from ._fused import _rv_to_meeMl0
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -41,4 +45,12 @@ def meeMl0_rv(T, rv, mu=1.0):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml0 = mean longitude at epoch
     """
-    return meeMl0_mee(T, mee_rv(rv))
+    if HAVE_NUMBA and np.size(T) == rv.shape[0]:
+        T = np.ascontiguousarray(np.ravel(T), dtype=np.float64)
+        rv = np.ascontiguousarray(rv, dtype=np.float64)
+        out = np.empty(rv.shape)
+        _rv_to_meeMl0(T, rv, float(mu), out)
+        return out
+
+    mee = mee_rv_soa(to_soa(rv), mu=mu)
+    return from_soa(meeMl0_mee_soa(T, mee, mu=mu))
@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -34,10 +35,24 @@ def meeMl_meeEl(meeEl):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml = mean longitude
     """
-    f = meeEl[:, 1:2]
-    g = meeEl[:, 2:3]
-    El = meeEl[:, 5:6]
+    return from_soa(meeMl_meeEl_soa(to_soa(meeEl)))
+
+
+def meeMl_meeEl_soa(meeEl):
+    """Column-wise form of meeMl_meeEl.
+
+    See meeMl_meeEl for the definitions of the elements.
+
+    Args:
+        meeEl: tuple
+            (p, f, g, h, k, El) tuple of (m,) arrays.
+
+    Returns:
+        meeMl: tuple
+            (p, f, g, h, k, Ml) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, El = meeEl
 
     Ml = np.mod(El - f*np.sin(El) + g*np.cos(El), 2*np.pi)
 
-    return np.concatenate((meeEl[:, 0:5], Ml), axis=1)
+    return p, f, g, h, k, Ml
@@ -1,5 +1,6 @@
-from .meeEl_meefl import meeEl_meefl
-from .meeMl_meeEl import meeMl_meeEl
+from .soa import to_soa, from_soa
+from .meeEl_meefl import meeEl_meefl_soa
+from .meeMl_meeEl import meeMl_meeEl_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -35,4 +36,20 @@ def meeMl_meefl(meefl):
             k = 2-component of the ascending node vector in equinoctial frame
             Ml = mean longitude
     """
-    return meeMl_meeEl(meeEl_meefl(meefl))
+    return from_soa(meeMl_meefl_soa(to_soa(meefl)))
+
+
+def meeMl_meefl_soa(meefl):
+    """Column-wise form of meeMl_meefl.
+
+    See meeMl_meefl for the definitions of the elements.
+
+    Args:
+        meefl: tuple
+            (p, f, g, h, k, fl) tuple of (m,) arrays.
+
+    Returns:
+        meeMl: tuple
+            (p, f, g, h, k, Ml) tuple of (m,) arrays.
+    """
+    return meeMl_meeEl_soa(meeEl_meefl_soa(meefl))
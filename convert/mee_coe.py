@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -34,12 +35,23 @@ def mee_coe(coe):
             k = 2-component of the ascending node vector in equinoctial frame
             L = true longitude
     """
-    a = coe[0:, 0:1]
-    e = coe[0:, 1:2]
-    i = coe[0:, 2:3]
-    W = coe[0:, 3:4]
-    w = coe[0:, 4:5]
-    nu = coe[0:, 5:6]
+    return from_soa(mee_coe_soa(to_soa(coe)))
+
+
+def mee_coe_soa(coe):
+    """Column-wise form of mee_coe.
+
+    See mee_coe for the definitions of the elements.
+
+    Args:
+        coe: tuple
+            (a, e, i, W, w, nu) tuple of (m,) arrays.
+
+    Returns:
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+    """
+    a, e, i, W, w, nu = coe
 
     # semi-latus rectum
     p = a * (1 - e**2)
@@ -55,4 +67,4 @@ def mee_coe(coe):
     # true longitude
     L = np.mod(W+w+nu, 2*np.pi)
 
-    return np.concatenate((p, f, g, h, k, L), axis=1)
+    return p, f, g, h, k, L
@@ -1,5 +1,6 @@
 import numpy as np
-from .meefl_meeMl import meefl_meeMl
+from .soa import to_soa, from_soa
+from .meefl_meeMl import meefl_meeMl_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -40,13 +41,29 @@ def mee_meeMl0(T, meeMl0, mu=1.0):
             k = 2-component of the ascending node vector in equinoctial frame
             L = true longitude
     """
-    p = meeMl0[:, 0:1]
-    f = meeMl0[:, 1:2]
-    g = meeMl0[:, 2:3]
-    Ml0 = meeMl0[:, 5:6]
+    return from_soa(mee_meeMl0_soa(T, to_soa(meeMl0), mu=mu))
+
+
+def mee_meeMl0_soa(T, meeMl0, mu=1.0):
+    """Column-wise form of mee_meeMl0.
+
+    See mee_meeMl0 for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        T: ndarray
+            (m, 1) array of times.
+        meeMl0: tuple
+            (p, f, g, h, k, Ml0) tuple of (m,) arrays.
+
+    Returns:
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, Ml0 = meeMl0
 
     a = p / (1 - f**2 - g**2)
     n = (mu / a**3)**0.5
-    Ml = Ml0 + n*T
+    Ml = Ml0 + n*np.ravel(T)
 
-    return meefl_meeMl(np.concatenate((meeMl0[:, 0:5], Ml), axis=1))
+    return meefl_meeMl_soa((p, f, g, h, k, Ml))
@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -38,54 +39,59 @@ def mee_rv(rv, mu=1.):
             k = 2-component of the ascending node vector in the perifocal frame
             L = true longitude
     """
-    r = rv[0:, 0:3]
-    v = rv[0:, 3:6]
-    m = rv.shape[0]
+    return from_soa(mee_rv_soa(to_soa(rv), mu=mu))
 
-    r_norm = np.linalg.norm(r, ord=2, axis=1, keepdims=True)
+
+def mee_rv_soa(rv, mu=1.):
+    """Column-wise form of mee_rv.
+
+    See mee_rv for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        rv: tuple
+            (rx, ry, rz, vx, vy, vz) tuple of (m,) arrays.
+
+    Returns:
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+    """
+    rx, ry, rz, vx, vy, vz = rv
+
+    r_norm = (rx**2 + ry**2 + rz**2)**.5
 
     # angular momentum
-    ang_mom = np.cross(r, v)
-    ang_mom_norm = np.linalg.norm(ang_mom, ord=2, axis=1, keepdims=True)
-    ang_mom_hat = ang_mom / ang_mom_norm
+    Hx = ry*vz - rz*vy
+    Hy = rz*vx - rx*vz
+    Hz = rx*vy - ry*vx
+    H_norm = (Hx**2 + Hy**2 + Hz**2)**.5
 
     # semilatus rectum
-    p = ang_mom_norm**2 / mu
+    p = H_norm**2 / mu
 
     # equinocital 1,2-components of ascending node vector
-    h = -ang_mom_hat[0:, 1:2] / (1. + ang_mom_hat[0:, 2:3])
-    k = ang_mom_hat[0:, 0:1] / (1. + ang_mom_hat[0:, 2:3])
-
-    # construct direction cosine matrix from equinoctial to ECI frame
-    h1 = h.reshape((m, 1, 1))
-    k1 = k.reshape((m, 1, 1))
-    h2 = h1**2
-    k2 = k1**2
-
-    DCM = np.concatenate((
-        np.concatenate((1+h2-k2, 2*h1*k1, 2*k1), axis=2),
-        np.concatenate((2*h1*k1, 1-h2+k2, -2*h1), axis=2),
-        np.concatenate((-2*k1, 2*h1, 1-h2-k2), axis=2),
-    ), axis=1) / (1. + h2 + k2)
+    h = -(Hy/H_norm) / (1. + Hz/H_norm)
+    k = (Hx/H_norm) / (1. + Hz/H_norm)
 
     # equinoctial 1,2-unit vectors in ECI frame
-    one = np.ones((m, 1, 1))
-    zero = np.zeros((m, 1, 1))
-    f_equ = np.concatenate((one, zero, zero), axis=1)
-    g_equ = np.concatenate((zero, one, zero), axis=1)
-    f_eci = (DCM @ f_equ)
-    g_eci = (DCM @ g_equ)
+    h2 = h**2
+    k2 = k**2
+    s = 1. + h2 + k2
+    fx, fy, fz = (1+h2-k2)/s, 2*h*k/s, -2*k/s
+    gx, gy, gz = 2*h*k/s, (1-h2+k2)/s, 2*h/s
 
     # eccentricity vector
-    e = np.cross(v, ang_mom)/mu - r/r_norm
+    ex = (vy*Hz - vz*Hy)/mu - rx/r_norm
+    ey = (vz*Hx - vx*Hz)/mu - ry/r_norm
+    ez = (vx*Hy - vy*Hx)/mu - rz/r_norm
 
     # equinoctial 1,2-components of eccentricity vector
-    f = (e.reshape((m, 1, 3)) @ f_eci).reshape((m, 1))
-    g = (e.reshape((m, 1, 3)) @ g_eci).reshape((m, 1))
+    f = ex*fx + ey*fy + ez*fz
+    g = ex*gx + ey*gy + ez*gz
 
     # true longitude
-    cL = (r.reshape((m, 1, 3)) @ f_eci).reshape((m, 1))
-    sL = (r.reshape((m, 1, 3)) @ g_eci).reshape((m, 1))
+    cL = rx*fx + ry*fy + rz*fz
+    sL = rx*gx + ry*gy + rz*gz
     L = np.mod(np.arctan2(sL, cL), 2*np.pi)
 
-    return np.concatenate((p, f, g, h, k, L), axis=1)
+    return p, f, g, h, k, L
@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -34,9 +35,23 @@ def meefl_meeEl(meeEl):
             k = 2-component of the ascending node vector in equinoctial frame
             fl = true longitude
     """
-    f = meeEl[:, 1:2]
-    g = meeEl[:, 2:3]
-    El = meeEl[:, 5:6]
+    return from_soa(meefl_meeEl_soa(to_soa(meeEl)))
+
+
+def meefl_meeEl_soa(meeEl):
+    """Column-wise form of meefl_meeEl.
+
+    See meefl_meeEl for the definitions of the elements.
+
+    Args:
+        meeEl: tuple
+            (p, f, g, h, k, El) tuple of (m,) arrays.
+
+    Returns:
+        meefl: tuple
+            (p, f, g, h, k, fl) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, El = meeEl
 
     e = (f**2 + g**2)**0.5
     B = ((1 + e) / (1 - e))**0.5
@@ -48,4 +63,4 @@ def meefl_meeEl(meeEl):
                    (1 - tan_f_by_2 * tan_wbar_by_2))
     fl = np.mod(2*np.arctan(tan_fl_by_2), 2*np.pi)
 
-    return np.concatenate((meeEl[:, 0:5], fl), axis=1)
+    return p, f, g, h, k, fl
@@ -1,5 +1,6 @@
-from .meeEl_meeMl import meeEl_meeMl
-from .meefl_meeEl import meefl_meeEl
+from .soa import to_soa, from_soa
+from .meeEl_meeMl import meeEl_meeMl_soa
+from .meefl_meeEl import meefl_meeEl_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -35,4 +36,20 @@ def meefl_meeMl(meeMl):
             k = 2-component of the ascending node vector in equinoctial frame
             fl = true longitude
     """
-    return meefl_meeEl(meeEl_meeMl(meeMl))
+    return from_soa(meefl_meeMl_soa(to_soa(meeMl)))
+
+
+def meefl_meeMl_soa(meeMl):
+    """Column-wise form of meefl_meeMl.
+
+    See meefl_meeMl for the definitions of the elements.
+
+    Args:
+        meeMl: tuple
+            (p, f, g, h, k, Ml) tuple of (m,) arrays.
+
+    Returns:
+        meefl: tuple
+            (p, f, g, h, k, fl) tuple of (m,) arrays.
+    """
+    return meefl_meeEl_soa(meeEl_meeMl_soa(meeMl))
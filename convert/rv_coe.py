@@ -1,5 +1,6 @@
-from .rv_mee import rv_mee
-from .mee_coe import mee_coe
+from .soa import to_soa, from_soa
+from .rv_mee import rv_mee_soa
+from .mee_coe import mee_coe_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -36,4 +37,20 @@ def rv_coe(coe):
         vy = velocity y-component
         vz = velocity z-component
     """
-    return rv_mee(mee_coe(coe))
+    return from_soa(rv_coe_soa(to_soa(coe)))
+
+
+def rv_coe_soa(coe):
+    """Column-wise form of rv_coe.
+
+    See rv_coe for the definitions of the elements.
+
+    Args:
+        coe: tuple
+            (a, e, i, W, w, nu) tuple of (m,) arrays.
+
+    Returns:
+        rv: tuple
+            (rx, ry, rz, vx, vy, vz) tuple of (m,) arrays.
+    """
+    return rv_mee_soa(mee_coe_soa(coe))
@@ -1,4 +1,5 @@
 import numpy as np
+from .soa import to_soa, from_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -38,43 +39,49 @@ def rv_mee(mee, mu=1.):
             vy = velocity y-component
             vz = velocity z-component
     """
-    m = mee.shape[0]
+    return from_soa(rv_mee_soa(to_soa(mee), mu=mu))
 
-    p = mee[0:, 0:1]
-    f = mee[0:, 1:2]
-    g = mee[0:, 2:3]
-    h = mee[0:, 3:4].reshape((m, 1, 1))
-    k = mee[0:, 4:5].reshape((m, 1, 1))
-    L = mee[0:, 5:6]
+
+def rv_mee_soa(mee, mu=1.):
+    """Column-wise form of rv_mee.
+
+    See rv_mee for the definitions of the elements and the
+    remaining arguments.
+
+    Args:
+        mee: tuple
+            (p, f, g, h, k, L) tuple of (m,) arrays.
+
+    Returns:
+        rv: tuple
+            (rx, ry, rz, vx, vy, vz) tuple of (m,) arrays.
+    """
+    p, f, g, h, k, L = mee
 
     cL = np.cos(L)
     sL = np.sin(L)
-
-    r = p / (1. + f*cL + g*sL)
+    w = 1. + f*cL + g*sL
 
     # r in equinoctial frame
-    zero = np.zeros(p.shape)
-    r_equ = r * np.concatenate((cL, sL, zero), 1)
+    r = p / w
+    x = r*cL
+    y = r*sL
 
     # v in equinoctial frame
     r_dot = (mu/p)**0.5 * (f*sL - g*cL)
-    rL_dot = (mu/p)**0.5 * (1. + f*cL + g*sL)
-    v_equ = np.concatenate((r_dot*cL - rL_dot*sL,
-                            r_dot*sL + rL_dot*cL,
-                            zero), 1)
+    rL_dot = (mu/p)**0.5 * w
+    vx = r_dot*cL - rL_dot*sL
+    vy = r_dot*sL + rL_dot*cL
 
-    # construct direction cosine matrix from equinoctial to ECI frame
+    # in-plane columns of direction cosine matrix from equinoctial to ECI
+    # frame, the out-of-plane components of r and v being zero
     h2 = h**2
     k2 = k**2
-
-    DCM = np.concatenate((
-        np.concatenate((1+h2-k2, 2*h*k, 2*k), axis=2),
-        np.concatenate((2*h*k, 1-h2+k2, -2*h), axis=2),
-        np.concatenate((-2*k, 2*h, 1-h2-k2), axis=2),
-    ), axis=1) / (1. + h2 + k2)
+    s = 1. + h2 + k2
+    D00, D01 = (1+h2-k2)/s, 2*h*k/s
+    D10, D11 = 2*h*k/s, (1-h2+k2)/s
+    D20, D21 = -2*k/s, 2*h/s
 
     # represent r and v in ECI frame
-    r_eci = (DCM @ r_equ.reshape((m, 3, 1))).reshape((m, 3))
-    v_eci = (DCM @ v_equ.reshape((m, 3, 1))).reshape((m, 3))
-
-    return np.concatenate((r_eci, v_eci), axis=1)
+    return (D00*x + D01*y, D10*x + D11*y, D20*x + D21*y,
+            D00*vx + D01*vy, D10*vx + D11*vy, D20*vx + D21*vy)
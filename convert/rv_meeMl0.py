@@ -1,5 +1,9 @@
-from .rv_mee import rv_mee
-from .mee_meeMl0 import mee_meeMl0
+import numpy as np
+from orbital_elements._jit import HAVE_NUMBA
+from .soa import to_soa, from_soa
+from .rv_mee import rv_mee_soa
+from .mee_meeMl0 import mee_meeMl0_soa
+from ._fused import _meeMl0_to_rv
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -41,4 +45,12 @@ def rv_meeMl0(T, meeMl0, mu=1.0):
             vy = velocity y-component
             vz = velocity z-component
     """
-    return rv_mee(mee_meeMl0(T, meeMl0))
+    if HAVE_NUMBA and np.size(T) == meeMl0.shape[0]:
+        T = np.ascontiguousarray(np.ravel(T), dtype=np.float64)
+        meeMl0 = np.ascontiguousarray(meeMl0, dtype=np.float64)
+        out = np.empty(meeMl0.shape)
+        _meeMl0_to_rv(T, meeMl0, float(mu), out)
+        return out
+
+    mee = mee_meeMl0_soa(T, to_soa(meeMl0), mu=mu)
+    return from_soa(rv_mee_soa(mee, mu=mu))
@@ -0,0 +1,44 @@
+import numpy as np
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+
+def to_soa(X):
+    """Split an array of states into a tuple of contiguous columns.
+
+    The state array is transposed to column-major order once, so each column
+    of the returned tuple is a contiguous (m,) view. The *_soa variants of the
+    converters take and return such tuples, which lets a chain of conversions
+    work on contiguous columns without rebuilding an (m, n) array between
+    stages.
+
+    Args:
+        X: ndarray
+            (m, n) array of states.
+
+    Returns:
+        columns: tuple
+            n-tuple of (m,) arrays, one per state component.
+    """
+    return tuple(np.asfortranarray(X).T)
+
+
+def from_soa(columns):
+    """Stack a tuple of state columns into an array of states.
+
+    Args:
+        columns: tuple
+            n-tuple of (m,) arrays, one per state component. Columns of
+            length 1 are broadcast against the others.
+
+    Returns:
+        X: ndarray
+            (m, n) array of states.
+    """
+    return np.stack(np.broadcast_arrays(*columns), axis=1)
@@ -1,4 +1,9 @@
+from functools import partial
+
 import numpy as np
+from orbital_elements._batch import flatten_batch
+from orbital_elements._gve import apply_gve
+from orbital_elements.backend import compile_rhs, get_array_module
 from orbital_elements.meeMl0.gve import GVE
 
 __author__ = "Nathan I. Budd"
@@ -10,6 +15,61 @@ __status__ = "Production"
 __date__ = "19 Mar 2017"
 
 
+def _constant_thrust_xp(xp, T, X, u, mu, iterations=8):
+    """Constant thrust meeMl0 derivatives written against the array module xp.
+
+    Column-form counterpart of ConstantThrust.__call__ for the CuPy and JAX
+    backends. It updates no arrays in place and has no data-dependent control
+    flow, so jax.jit can trace it. Kepler's equation therefore takes a fixed
+    number of Newton iterations from the starting guess used by the fused
+    conversion kernels, instead of iterating to a tolerance.
+    """
+    p, f, g, h, k, Ml0 = (X[..., j] for j in range(6))
+    T = xp.broadcast_to(T, X.shape[:-1] + (1,))[..., 0]
+
+    # true longitude from mean longitude at epoch (mee_meeMl0)
+    b2 = 1. - f**2 - g**2
+    Ml = Ml0 + (mu / (p/b2)**3)**.5 * T
+    El = Ml + xp.sign(f*xp.sin(Ml) - g*xp.cos(Ml))*(f**2 + g**2)**.5
+    for _ in range(iterations):
+        El = El - ((Ml - El + f*xp.sin(El) - g*xp.cos(El)) /
+                   (-1. + f*xp.cos(El) + g*xp.sin(El)))
+
+    e = (f**2 + g**2)**.5
+    B = ((1. + e) / (1. - e))**.5
+    tan_wbar_by_2 = ((e - f) / (e + f))**.5
+    tan_El_by_2 = xp.tan(El/2.)
+    tan_f_by_2 = B * ((tan_El_by_2 - tan_wbar_by_2) /
+                      (1. + tan_El_by_2 * tan_wbar_by_2))
+    L = 2.*xp.arctan((tan_f_by_2 + tan_wbar_by_2) /
+                     (1. - tan_f_by_2 * tan_wbar_by_2))
+
+    # GVE matrices applied to the LVLH acceleration (GVE, apply_gve)
+    u_r, u_t, u_h = u[0], u[1], u[2]
+    sL = xp.sin(L)
+    cL = xp.cos(L)
+    s = 1. + h**2 + k**2
+    w = 1. + f*cL + g*sL
+    q = (h*sL - k*cL) / w
+    b_by_a = b2**.5
+    a_by_a_plus_b = 1. / (1. + b_by_a)
+    n_coef = -3. * (mu / p**3)**.5 * b_by_a
+
+    Mldot = -((a_by_a_plus_b * w*(w-1.) + 2.*b_by_a) * u_r +
+              a_by_a_plus_b * (w+1.) * (g*cL - f*sL) * u_t +
+              (k*cL - h*sL) * u_h) / w
+    ndot = n_coef * ((f*sL - g*cL)*u_r + w*u_t)
+
+    return ((p / mu)**.5)[..., None] * xp.stack((
+        2.*p/w * u_t,
+        sL*u_r + ((w+1.)*cL + f)/w * u_t - g*q * u_h,
+        -cL*u_r + ((w+1.)*sL + g)/w * u_t + f*q * u_h,
+        s*cL/2./w * u_h,
+        s*sL/2./w * u_h,
+        Mldot - ndot*T,
+    ), axis=-1)
+
+
 class ConstantThrust(object):
     """Constant LVLH acceleration as constant MEE time derivatives.
 
@@ -21,15 +81,31 @@ class ConstantThrust(object):
             Standard Gravitational Parameter. Defaults to 1.0, the standard
             value in canonical units.
         u: ndarray
-            (m, 3) array of control accelerations in the LVLH frame.
+            (m, 3) read-only array of control accelerations in the LVLH frame.
+        dtype: data-type, optional
+            Floating point type of states and results. Defaults to
+            np.float64.
+        backend: str, optional
+            Array backend, one of 'numpy', 'cupy', or 'jax'. Defaults to
+            'numpy'. Other backends take and return arrays on their own
+            device and leave u unset.
     """
 
-    def __init__(self, vector, mu=1.0):
+    def __init__(self, vector, mu=1.0, dtype=np.float64, backend='numpy'):
         self.vector = vector
         self.mu = mu
         self.u = np.array([])
+        self.dtype = np.dtype(dtype)
+        self._vec_row = np.ascontiguousarray(
+            vector, dtype=self.dtype).reshape((1, 3))
+        self._gve = GVE(mu=self.dtype.type(mu))
+        self.backend = backend
+        self.xp = get_array_module(backend)
+        self._rhs = compile_rhs(backend, partial(
+            _constant_thrust_xp, self.xp,
+            u=tuple(float(u_k) for u_k in np.ravel(vector)), mu=mu))
 
-    def __call__(self, T, X):
+    def __call__(self, T, X, return_aux=False):
         """Calculate constant acceleration as MEE time derivatives.
 
         Args:
@@ -44,14 +120,36 @@ class ConstantThrust(object):
                 h = 1-component of the ascending node vector in equ. frame
                 k = 2-component of the ascending node vector in equ. frame
                 Ml0 = mean longitude at epoch
+                An (N, m, 6) ensemble of N trajectories is also accepted.
+            return_aux: bool, optional
+                If True, return the control accelerations alongside the state
+                derivatives instead of setting u. Defaults to False.
 
         Returns:
             Xdot: ndarray
-                (m, 6) array of state derivatives.
+                (m, 6) array of state derivatives, or (N, m, 6) for an
+                ensemble.
+            aux: dict
+                Only if return_aux is True. Holds the read-only (m, 3) array
+                u, with N*m rows for an ensemble, or nothing for backends
+                other than NumPy.
         """
+        if self.backend != 'numpy':
+            Xdot = self._rhs(T, self.xp.asarray(X, dtype=self.dtype))
+            return (Xdot, {}) if return_aux else Xdot
+
+        shape = X.shape
+        T, X = flatten_batch(np.asarray(T, dtype=self.dtype),
+                             np.asarray(X, dtype=self.dtype))
         m = T.shape[0]
-        u = np.tile(self.vector, (m, 1, 1))
-        G = GVE(mu=self.mu)(T, X)
-        self.u = u.reshape((m, 3))
+        u = np.broadcast_to(self._vec_row, (m, 3))
+        G = self._gve(T, X)
+
+        Xdot = np.empty(shape, dtype=self.dtype)
+        apply_gve(G, u, out=Xdot.reshape((-1, 6)))
+
+        if return_aux:
+            return Xdot, {'u': u}
+        self.u = u
 
-        return (G @ u).reshape((m, 6))
+        return Xdot
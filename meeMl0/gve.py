@@ -71,7 +71,7 @@ class GVE(object):
         s = 1. + h**2 + k**2
         w = 1. + f*cL + g*sL
         q = (h*sL - k*cL) / w
-        zero = np.zeros(dims)
+        zero = np.zeros(dims, dtype=X_L.dtype)
 
         pdot = np.concatenate((zero, 2*p/w, zero), axis=2)
         fdot = np.concatenate((sL, ((w+1.)*cL + f)/w, -g*q), axis=2)
@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from orbital_elements.utilities.integrate import integrate
+
+__author__ = "Nathan I. Budd"
+__email__ = "nibudd@gmail.com"
+__copyright__ = "Copyright 2017, LASR Lab"
+__license__ = "MIT"
+__version__ = "0.1"
+__status__ = "Production"
+__date__ = "15 Oct 2026"
+
+
+def _propagate_slab(rhs_factory, T, X0, kwargs):
+    """Propagate a slab of initial states serially within one worker."""
+    rhs = rhs_factory()
+
+    def f(t, x):
+        return rhs(np.array([[t]]), x.reshape((1, -1))).reshape(-1)
+
+    return np.stack([integrate(f, x0, T, **kwargs) for x0 in X0])
+
+
+def propagate_ensemble(rhs_factory, T, X0, n_workers=None, **kwargs):
+    """Propagate an ensemble of initial states across worker processes.
+
+    The initial states are split into one slab per worker. Each worker builds
+    its own dynamics from rhs_factory, so only the factory has to be
+    picklable, not the dynamics objects themselves. Workers are spawned rather
+    than forked, since forking a process whose Numba thread pool is already
+    running can deadlock the children.
+
+    args:
+        rhs_factory: callable
+            Picklable callable taking no arguments, e.g. a module-level
+            function, that returns the state time derivatives. These take
+            inputs (T, X), where T is an (m, 1) array of times and X is an
+            (m, n) array of states, as SystemDynamics does. Spawned workers
+            re-import the calling script, so a script must call
+            propagate_ensemble under an if __name__ == "__main__": guard.
+        T: ndarray
+            (m,) array of times at which the states should be returned.
+        X0: ndarray
+            (N, n) array of initial states, one row per ensemble member.
+        n_workers: int, optional
+            Number of worker processes. Defaults to the number of CPUs.
+        kwargs: dict
+            Additional keyword arguments for integrate.
+    returns:
+        X: ndarray
+            (N, m, n) array of the states of each ensemble member at each
+            time in T.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    slabs = [slab for slab in np.array_split(X0, n_workers) if slab.size]
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(slabs),
+                             mp_context=context) as executor:
+        futures = [executor.submit(_propagate_slab, rhs_factory, T, slab,
+                                   kwargs)
+                   for slab in slabs]
+        return np.concatenate([future.result() for future in futures])
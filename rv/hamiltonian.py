@@ -1,4 +1,6 @@
 import numpy as np
+from orbital_elements._jit import HAVE_NUMBA, njit, prange
+from orbital_elements._zonal_c import HAVE_ZONAL_C, zonal_hamiltonian
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -9,6 +11,78 @@ __status__ = "Production"
 __date__ = "02 Mar 2017"
 
 
+J2_to_6 = (1082.63e-6, -2.52e-6, -1.61e-6, -.15e-6, .57e-6)
+
+# compiled Hamiltonian kernels, keyed by the number of J terms they include
+_kernels = {}
+
+
+def _make_hamiltonian_kernel(n_J):
+    """Compile a Hamiltonian kernel specialized to n_J zonal terms.
+
+    Numba freezes n_J and the J coefficients as compile-time constants, so
+    the terms beyond n_J are removed from the compiled kernel rather than
+    evaluated with zero coefficients. The kernels are not cached on disk:
+    every n_J closure shares one cache index, so cached variants collide
+    when a process loads more than one of them.
+
+    Args:
+        n_J: int
+            Number of zonal terms to include, starting from J2.
+
+    Returns:
+        kernel: callable
+            Takes inputs (X, mu, r_e), where X is an (m, 6) array of
+            position-velocity states, mu is the Standard Gravitational
+            Parameter, and r_e is the equatorial radius of Earth. Returns an
+            (m, 1) array of Hamiltonian values.
+    """
+    J2, J3, J4, J5, J6 = J2_to_6
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(X, mu, r_e):
+        m = X.shape[0]
+        H = np.empty((m, 1), dtype=X.dtype)
+
+        for i in prange(m):
+            rx, ry, rz = X[i, 0], X[i, 1], X[i, 2]
+            vx, vy, vz = X[i, 3], X[i, 4], X[i, 5]
+            r2 = rx*rx + ry*ry + rz*rz
+            r = np.sqrt(r2)
+            inv_r = 1. / r
+            s = rz * inv_r
+            s2 = s*s
+            ratio = r_e * inv_r
+            mu_by_r = mu * inv_r
+
+            # accumulate potential function terms, Legendre polynomials in
+            # Horner form, carrying the running power of (r_e/r)
+            V = -mu_by_r
+            ratio_k = ratio*ratio
+            if n_J >= 1:
+                V += J2/2. * mu_by_r * ratio_k * (3.*s2 - 1.)
+            ratio_k *= ratio
+            if n_J >= 2:
+                V += J3/2. * mu_by_r * ratio_k * (5.*s2 - 3.)*s
+            ratio_k *= ratio
+            if n_J >= 3:
+                V += J4/8. * mu_by_r * ratio_k * ((35.*s2 - 30.)*s2 + 3.)
+            ratio_k *= ratio
+            if n_J >= 4:
+                V += J5/8. * mu_by_r * ratio_k * (
+                    (63.*s2 - 70.)*s2 + 15.)*s
+            ratio_k *= ratio
+            if n_J >= 5:
+                V += J6/16. * mu_by_r * ratio_k * (
+                    ((231.*s2 - 315.)*s2 + 105.)*s2 - 5.)
+
+            H[i, 0] = .5 * (vx*vx + vy*vy + vz*vz) + V
+
+        return H
+
+    return kernel
+
+
 class Hamiltonian(object):
     """Hamiltonian for position-velocity elements.
 
@@ -23,12 +97,21 @@ class Hamiltonian(object):
         r_earth: float, optional
             Equatorial radius of Earth. Defaults to 1.0, Earth's radius in
             canonical units.
+        dtype: data-type, optional
+            Floating point type of states and results. Defaults to
+            np.float64.
     """
 
-    def __init__(self, mu=1.0, order=1, r_earth=1.0):
+    def __init__(self, mu=1.0, order=1, r_earth=1.0, dtype=np.float64):
         self.mu = mu
         self.order = order
         self.r_earth = r_earth
+        self.dtype = np.dtype(dtype)
+
+        # zonal coefficients J2 to J6, zeroed beyond the gravity order
+        self._n_J = max(0, min(order-1, 5))
+        self._J = np.zeros(5, dtype=self.dtype)
+        self._J[0:self._n_J] = J2_to_6[0:self._n_J]
 
     def __call__(self, T, X):
         """Calculate Hamiltonian.
@@ -46,43 +129,65 @@ class Hamiltonian(object):
                 vx = velocity x-component
                 vy = velocity y-component
                 vz = velocity z-component
+                An (N, m, 6) ensemble of N trajectories is also accepted.
 
         Returns:
             H_rel: ndarray
-                (m, 1) array of Hamiltonian over time.
+                (m, 1) array of Hamiltonian over time, or (N, m, 1) for an
+                ensemble.
         """
-        z = X[:, 2:3]
-        r = np.linalg.norm(X[0:, 0:3], ord=2, axis=1).reshape(z.shape)
-        v = np.linalg.norm(X[0:, 3:6], ord=2, axis=1).reshape(z.shape)
-        sin_phi = z/r
-
-        J2_to_6 = [1082.63e-6, -2.52e-6, -1.61e-6, -.15e-6, .57e-6]
-        J = J2_to_6[0:self.order-1]
-
-        # calculate and accumulate potential function terms for each J term
-        V = -self.mu/r
-
-        try:
-            # J2
-            V -= (-J[0]/2. * self.mu/r * (self.r_earth/r)**2 *
-                  (3.*sin_phi**2 - 1.))
-
-            # J3
-            V -= (-J[1]/2. * self.mu/r * (self.r_earth/r)**3 *
-                  (5.*sin_phi**3 - 3.*sin_phi))
-
-            # J4
-            V -= (-J[2]/8. * self.mu/r * (self.r_earth/r)**4 *
-                  (35.*sin_phi**4 - 30.*sin_phi**2 + 3.))
-
-            # J5
-            V -= (-J[3]/8. * self.mu/r * (self.r_earth/r)**5 *
-                  (63.*sin_phi**5 - 70.*sin_phi**3 + 15.*sin_phi))
-
-            # J6
-            V -= (-J[4]/16. * self.mu/r * (self.r_earth/r)**6 *
-                  (231.*sin_phi**6 - 315.*sin_phi**4 + 105.*sin_phi**2 - 5.))
-        except IndexError:
-            pass
-
-        return .5 * v**2 + V
+        shape = X.shape[:-1] + (1,)
+        X = np.asarray(X, dtype=self.dtype).reshape((-1, 6))
+
+        if HAVE_ZONAL_C and self.dtype == np.float64:
+            return zonal_hamiltonian(X, self.mu, self.r_earth, self._J,
+                                     self._n_J).reshape(shape)
+
+        if HAVE_NUMBA:
+            if self._n_J not in _kernels:
+                _kernels[self._n_J] = _make_hamiltonian_kernel(self._n_J)
+            return _kernels[self._n_J](
+                np.ascontiguousarray(X), self.dtype.type(self.mu),
+                self.dtype.type(self.r_earth)).reshape(shape)
+
+        r_ = X[:, 0:3]
+        v_ = X[:, 3:6]
+        v2 = np.einsum('ij,ij->i', v_, v_).reshape((-1, 1))
+        r_e = self.dtype.type(self.r_earth)
+        r = np.sqrt(np.einsum('ij,ij->i', r_, r_)).reshape((-1, 1))
+        inv_r = 1. / r
+        sin_phi = X[:, 2:3] * inv_r
+        s2 = sin_phi * sin_phi
+        re_by_r = r_e * inv_r
+        mu_by_r = self.dtype.type(self.mu) * inv_r
+
+        J = self._J
+
+        # calculate and accumulate potential function terms for each J term,
+        # carrying mu/r * (r_earth/r)**k as a running product and evaluating
+        # the Legendre polynomials in Horner form
+        V = -mu_by_r
+        mu_ratio_k = mu_by_r * re_by_r
+
+        # J2
+        mu_ratio_k = mu_ratio_k * re_by_r
+        V -= -J[0]/2. * mu_ratio_k * (3.*s2 - 1.)
+
+        # J3
+        mu_ratio_k = mu_ratio_k * re_by_r
+        V -= -J[1]/2. * mu_ratio_k * (5.*s2 - 3.)*sin_phi
+
+        # J4
+        mu_ratio_k = mu_ratio_k * re_by_r
+        V -= -J[2]/8. * mu_ratio_k * ((35.*s2 - 30.)*s2 + 3.)
+
+        # J5
+        mu_ratio_k = mu_ratio_k * re_by_r
+        V -= -J[3]/8. * mu_ratio_k * ((63.*s2 - 70.)*s2 + 15.)*sin_phi
+
+        # J6
+        mu_ratio_k = mu_ratio_k * re_by_r
+        V -= -J[4]/16. * mu_ratio_k * (
+            ((231.*s2 - 315.)*s2 + 105.)*s2 - 5.)
+
+        return (.5 * v2 + V).reshape(shape)
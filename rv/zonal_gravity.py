@@ -9,6 +9,42 @@ __status__ = "Production"
 __date__ = "03 Mar 2017"
 
 
+class _ZonalIntermediates(object):
+    """Position-derived quantities shared by the zonal gravity J terms.
+
+    Attributes:
+        r: ndarray
+            (m, 1) array of position magnitudes.
+        inv_r: ndarray
+            (m, 1) array of 1/r.
+        xbr, ybr, sin_phi: ndarray
+            (m, 1) arrays of the position components divided by r. sin_phi,
+            the sine of the geocentric latitude, is z/r.
+    """
+
+    def __init__(self, R):
+        self.r = np.sqrt(np.einsum('ij,ij->i', R, R)).reshape((-1, 1))
+        self.inv_r = 1. / self.r
+        self.xbr = R[:, 0:1] * self.inv_r
+        self.ybr = R[:, 1:2] * self.inv_r
+        self.sin_phi = R[:, 2:3] * self.inv_r
+        self._ratio_pows = {}
+        self._sin_phi_pows = {1: self.sin_phi}
+
+    def ratio_pow(self, r_earth, k):
+        """Return (r_earth/r)**k as an (m, 1) array."""
+        key = (r_earth, k)
+        if key not in self._ratio_pows:
+            self._ratio_pows[key] = (r_earth * self.inv_r)**k
+        return self._ratio_pows[key]
+
+    def sin_phi_pow(self, k):
+        """Return sin_phi**k as an (m, 1) array."""
+        if k not in self._sin_phi_pows:
+            self._sin_phi_pows[k] = self.sin_phi**k
+        return self._sin_phi_pows[k]
+
+
 class ZonalGravity(object):
     """Zonal gravity dynamics for position-velocity elements (in ECI frame).
 
@@ -47,6 +83,8 @@ class ZonalGravity(object):
     def eci_acceleration(self, T, X):
         """Calculate accelerations due to zonal gravity in ECI frame.
 
+        Sets a_eci.
+
         Args:
             T: ndarray
                 (m, 1) array of times.
@@ -60,73 +98,86 @@ class ZonalGravity(object):
                 vy = velocity y-component
                 vz = velocity z-component
         """
+        self.a_eci = self._eci_acceleration(T, X)
+
+    def _eci_acceleration(self, T, X, q=None):
+        """Return the (m, 3) zonal gravity accelerations in the ECI frame."""
+        if q is None:
+            q = _ZonalIntermediates(X[:, 0:3])
         m = X.shape[0]
-        r = np.linalg.norm(X[0:, 0:3], ord=2, axis=1).reshape((m, 1))
-        xbr = X[:, 0:1] / r
-        ybr = X[:, 1:2] / r
-        zbr = X[:, 2:3] / r
+        r = q.r
+        xbr = q.xbr
+        ybr = q.ybr
+        zbr = q.sin_phi
+        zbr2 = q.sin_phi_pow(2)
+        ratio = q.ratio_pow
+        r_e = self.r_earth
 
         J2_to_6 = [1082.63e-6, -2.52e-6, -1.61e-6, -.15e-6, .57e-6]
         J = J2_to_6[0:self.order-1]
 
         # calculate and accumulate acceleration terms for each J term
-        self.a_eci = np.zeros((m, 3))
+        a_eci = np.zeros((m, 3), dtype=X.dtype)
         try:
             # J2
-            self.a_eci += (
-                (-3./2. * J[0] * (self.mu/r**2) * (self.r_earth/r)**2) *
+            a_eci += (
+                (-3./2. * J[0] * (self.mu/r**2) * ratio(r_e, 2)) *
                 np.concatenate((
-                    (1. - 5.*zbr**2) * xbr,
-                    (1. - 5.*zbr**2) * ybr,
-                    (3. - 5.*zbr**2) * zbr
+                    (1. - 5.*zbr2) * xbr,
+                    (1. - 5.*zbr2) * ybr,
+                    (3. - 5.*zbr2) * zbr
                 ), axis=1)
             )
 
             # J3
-            self.a_eci += (
-                (1./2. * J[1] * (self.mu/r**2) * (self.r_earth/r)**3) *
+            a_eci += (
+                (1./2. * J[1] * (self.mu/r**2) * ratio(r_e, 3)) *
                 np.concatenate((
                     5.*(7.*zbr**3 - 3.*zbr) * xbr,
                     5.*(7.*zbr**3 - 3.*zbr) * ybr,
-                    3.*(1. - 10.*zbr**2 + 35./3.*zbr**4)
+                    3.*(1. - 10.*zbr2 + 35./3.*zbr**4)
                 ), axis=1)
             )
 
             # J4
-            self.a_eci += (
-                (5./8. * J[2] * (self.mu/r**2) * (self.r_earth/r)**4) *
+            a_eci += (
+                (5./8. * J[2] * (self.mu/r**2) * ratio(r_e, 4)) *
                 np.concatenate((
-                    (3. - 42.*zbr**2 + 63.*zbr**4) * xbr,
-                    (3. - 42.*zbr**2 + 63.*zbr**4) * ybr,
-                    (15. - 70.*zbr**2 + 63.*zbr**4) * zbr
+                    (3. - 42.*zbr2 + 63.*zbr**4) * xbr,
+                    (3. - 42.*zbr2 + 63.*zbr**4) * ybr,
+                    (15. - 70.*zbr2 + 63.*zbr**4) * zbr
                 ), axis=1)
             )
 
             # J5
-            self.a_eci += (
-                (1./8. * J[3] * (self.mu/r**2) * (self.r_earth/r)**5) *
+            a_eci += (
+                (1./8. * J[3] * (self.mu/r**2) * ratio(r_e, 5)) *
                 np.concatenate((
                     3.*(35.*zbr - 210.*zbr**3 + 231.*zbr**5) * xbr,
                     3.*(35.*zbr - 210.*zbr**3 + 231.*zbr**5) * ybr,
-                    (-15. + 315.*zbr**2 - 945.*zbr**4 + 693.*zbr**6)
+                    (-15. + 315.*zbr2 - 945.*zbr**4 + 693.*zbr**6)
                 ), axis=1)
             )
 
             # J6
-            self.a_eci += (
-                (-1./16. * J[4] * (self.mu/r**2) * (self.r_earth/r)**6) *
+            a_eci += (
+                (-1./16. * J[4] * (self.mu/r**2) * ratio(r_e, 6)) *
                 np.concatenate((
-                    (35. - 945.*zbr**2 + 3465.*zbr**4 - 3003.*zbr**6) * xbr,
-                    (35. - 945.*zbr**2 + 3465.*zbr**4 - 3003.*zbr**6) * ybr,
-                    (245. - 2205.*zbr**2 + 4851.*zbr**4 - 3003.*zbr**6) * zbr
+                    (35. - 945.*zbr2 + 3465.*zbr**4 - 3003.*zbr**6) * xbr,
+                    (35. - 945.*zbr2 + 3465.*zbr**4 - 3003.*zbr**6) * ybr,
+                    (245. - 2205.*zbr2 + 4851.*zbr**4 - 3003.*zbr**6) * zbr
                 ), axis=1)
             )
         except IndexError:
             pass
 
+        return a_eci
+
     def lvlh_acceleration(self, T, X):
         """Calculate accelerations due to zonal gravity in LVLH frame.
 
+        Sets a_eci and a_lvlh.
+
         Args:
             T: ndarray
                 (m, 1) array of times.
@@ -140,6 +191,10 @@ class ZonalGravity(object):
                 vy = velocity y-component
                 vz = velocity z-component
         """
+        self.a_eci, self.a_lvlh = self._lvlh_acceleration(T, X)
+
+    def _lvlh_acceleration(self, T, X):
+        """Return the (m, 3) zonal gravity accelerations in ECI and LVLH."""
         # rotate acceleratoin vector from the ECI into the LVLH frame
         r_ = X[:, 0:3]
         v_ = X[:, 3:6]
@@ -148,18 +203,19 @@ class ZonalGravity(object):
         m = T.shape[0]
         dims = (m, 1, 3)
 
-        i_r = r_ / np.linalg.norm(r_, ord=2, axis=1, keepdims=True)
+        q = _ZonalIntermediates(X[:, 0:3])
+        i_r = r_ * q.inv_r
         i_h = h_ / np.linalg.norm(h_, ord=2, axis=1, keepdims=True)
         i_t = np.cross(i_h, i_r).reshape(dims)
         i_r = i_r.reshape(dims)
         i_h = i_h.reshape(dims)
 
         DCM = np.concatenate((i_r, i_t, i_h), axis=1)
-        self.eci_acceleration(T, X)
+        a_eci = self._eci_acceleration(T, X, q)
 
-        self.a_lvlh = (DCM @ self.a_eci.reshape((m, 3, 1))).reshape((m, 3))
+        return a_eci, (DCM @ a_eci.reshape((m, 3, 1))).reshape((m, 3))
 
-    def __call__(self, T, X):
+    def __call__(self, T, X, return_aux=False):
         """Calculate zonal gravity perturations in position-velocity elements.
 
         Args:
@@ -174,13 +230,23 @@ class ZonalGravity(object):
                 vx = velocity x-component
                 vy = velocity y-component
                 vz = velocity z-component
+            return_aux: bool, optional
+                If True, return the ECI acceleration alongside the state
+                derivatives instead of setting a_eci, so that the call has no
+                side effects and one instance can be shared between threads.
+                Defaults to False.
 
         Returns:
             Xdot: ndarray
                 (m, 6) array of state derivatives.
+            aux: dict
+                Only if return_aux is True. Holds the (m, 3) array a_eci.
         """
-        self.eci_acceleration(T, X)
+        a_eci = self._eci_acceleration(T, X)
+        Xdot = np.concatenate((np.zeros((T.shape[0], 3)), a_eci), axis=1)
+
+        if return_aux:
+            return Xdot, {'a_eci': a_eci}
+        self.a_eci = a_eci
 
-        return np.concatenate(
-            (np.zeros((T.shape[0], 3)), self.a_eci),
-            axis=1)
+        return Xdot
@@ -1,5 +1,7 @@
 """UnitTest classes for testing orbital_elements classes."""
+import importlib
 import unittest
+import unittest.mock
 import numpy as np
 import math
 import mcpyi
@@ -10,6 +12,9 @@ import orbital_elements.rv as rv
 import orbital_elements.coe as coe
 import orbital_elements.mee as mee
 import orbital_elements.meeMl0 as meeMl0
+import orbital_elements.parallel as parallel
+import orbital_elements._zonal_c as zonal_c
+from orbital_elements.convert.rv_coe import rv_coe_soa
 
 __author__ = "Nathan I. Budd"
 __email__ = "nibudd@gmail.com"
@@ -71,6 +76,56 @@ class TestRV(unittest.TestCase):
 
         np.testing.assert_allclose(H[0, 0], H, rtol=tol)
 
+    def test_hamiltonian_ensemble(self):
+        X = np.stack((rv.KeplerianSolution(rv_0)(T),
+                      rv.KeplerianSolution(rv_0 * 1.1)(T)))
+
+        order = 6
+        hamiltonian = rv.Hamiltonian(order=order)
+        H = hamiltonian(T, X)
+
+        self.assertEqual(H.shape, (2, m, 1))
+        for H_k, X_k in zip(H, X):
+            np.testing.assert_allclose(H_k, hamiltonian(T, X_k), rtol=tol)
+            np.testing.assert_allclose(H_k, hamiltonian(T.ravel(), X_k),
+                                       rtol=tol)
+
+    def test_hamiltonian_float32(self):
+        X = rv.KeplerianSolution(rv_0)(T)
+
+        order = 6
+        H = rv.Hamiltonian(order=order)(T, X)
+        H_32 = rv.Hamiltonian(order=order, dtype=np.float32)(T, X)
+
+        self.assertEqual(H_32.dtype, np.float32)
+        np.testing.assert_allclose(H_32, H, rtol=1e-6)
+
+    def test_hamiltonian_kernels(self):
+        X = rv.KeplerianSolution(rv_0)(T)
+
+        # build every specialization in one process
+        for order in range(1, 8):
+            hamiltonian = rv.Hamiltonian(order=order)
+            H = rv.hamiltonian._make_hamiltonian_kernel(hamiltonian._n_J)(
+                X, mu, 1.0)
+            with unittest.mock.patch.multiple(rv.hamiltonian,
+                                              HAVE_NUMBA=False,
+                                              HAVE_ZONAL_C=False):
+                H_np = hamiltonian(T, X)
+
+            np.testing.assert_allclose(H, H_np, rtol=tol)
+
+    @unittest.skipUnless(zonal_c.HAVE_ZONAL_C, 'lib_zonal_c is not built')
+    def test_hamiltonian_c_kernel(self):
+        X = rv.KeplerianSolution(rv_0)(T)
+
+        n_J = 5
+        J = np.array(rv.hamiltonian.J2_to_6)
+        H_c = zonal_c.zonal_hamiltonian(X, mu, 1.0, J, n_J)
+        H = rv.hamiltonian._make_hamiltonian_kernel(n_J)(X, mu, 1.0)
+
+        np.testing.assert_allclose(H_c, H, rtol=tol)
+
     def test_compare_dynamics_to_solution(self):
         X0 = rv_0
 
@@ -267,6 +322,97 @@ class TestCOE(unittest.TestCase):
 
         np.testing.assert_allclose(H[0, 0], H, rtol=tol)
 
+    def test_zonal_gravity_ensemble(self):
+        X = np.stack((coe_sltn, coe.KeplerianSolution(coe_0 * 1.1)(T)))
+
+        order_H = 6
+        zon_grav = coe.ZonalGravity(order=order_H)
+        Xdot = zon_grav(T, X)
+
+        self.assertEqual(Xdot.shape, (2, m, 6))
+        for Xdot_k, X_k in zip(Xdot, X):
+            np.testing.assert_allclose(Xdot_k, zon_grav(T, X_k), rtol=0,
+                                       atol=tol)
+            np.testing.assert_allclose(Xdot_k, zon_grav(T.ravel(), X_k),
+                                       rtol=0, atol=tol)
+
+    def test_zonal_gravity_float32(self):
+        X_32 = coe_sltn.astype(np.float32)
+
+        order = 6
+        Xdot = coe.ZonalGravity(order=order)(T, coe_sltn)
+        Xdot_32, aux = coe.ZonalGravity(order=order, dtype=np.float32)(
+            T, X_32, return_aux=True)
+
+        self.assertEqual(Xdot_32.dtype, np.float32)
+        self.assertEqual(aux['a_lvlh'].dtype, np.float32)
+        self.assertEqual(coe.GVE()(T, X_32).dtype, np.float32)
+        self.assertEqual(coe.GVE(trig_lookup=True)(T, X_32).dtype,
+                         np.float32)
+        np.testing.assert_allclose(Xdot_32, Xdot, rtol=0,
+                                   atol=1e-5*np.max(np.abs(Xdot)))
+
+    def test_zonal_gravity_memoize(self):
+        X = np.array(coe_sltn)
+        zon_grav = coe.ZonalGravity(order=6)
+        zon_grav_memo = coe.ZonalGravity(order=6, memoize=True)
+
+        np.testing.assert_array_equal(zon_grav_memo(T, X), zon_grav(T, X))
+        np.testing.assert_array_equal(zon_grav_memo(T, X), zon_grav(T, X))
+
+        # in-place updates of the state must not return stale derivatives
+        X[:, 0] *= 1.1
+        np.testing.assert_array_equal(zon_grav_memo(T, X), zon_grav(T, X))
+
+        # outputs handed to the caller must not alias the memo
+        _, aux = zon_grav_memo(T, X, return_aux=True)
+        a_eci = aux['a_eci'].copy()
+        aux['a_eci'][:] = 0.
+        zon_grav_memo.a_eci[:] = 0.
+        _, aux = zon_grav_memo(T, X, return_aux=True)
+        np.testing.assert_array_equal(aux['a_eci'], a_eci)
+
+    def test_zonal_gravity_return_aux(self):
+        zon_grav = coe.ZonalGravity(order=6)
+        Xdot, aux = zon_grav(T, coe_sltn, return_aux=True)
+
+        self.assertEqual(zon_grav.a_eci.size, 0)
+        self.assertEqual(zon_grav.a_lvlh.size, 0)
+        np.testing.assert_array_equal(Xdot, zon_grav(T, coe_sltn))
+        np.testing.assert_array_equal(aux['a_eci'], zon_grav.a_eci)
+        np.testing.assert_array_equal(aux['a_lvlh'], zon_grav.a_lvlh)
+
+    def test_zonal_gravity_backend_xp(self):
+        order = 6
+        Xdot = coe.ZonalGravity(order=order)(T, coe_sltn)
+        Xdot_xp = coe.zonal_gravity._zonal_gravity_xp(
+            np, T, coe_sltn, mu, rv.hamiltonian.J2_to_6[0:order-1], 1.0)
+
+        np.testing.assert_allclose(Xdot_xp, Xdot, rtol=0, atol=tol)
+        with self.assertRaises(ValueError):
+            coe.ZonalGravity(backend='torch')
+
+    def test_gve_trig_lookup(self):
+        G = coe.GVE()(T, coe_sltn)
+        G_lookup = coe.GVE(trig_lookup=True)(T, coe_sltn)
+
+        np.testing.assert_allclose(G_lookup, G, rtol=0,
+                                   atol=1e-6*np.max(np.abs(G)))
+
+        # non-finite states propagate instead of reading the grid
+        X = np.array(coe_sltn[0:2])
+        X[0, 5] = np.nan
+        X[1, 4] = np.inf
+        np.testing.assert_array_equal(
+            np.isnan(coe.GVE(trig_lookup=True)(T[0:2], X)),
+            np.isnan(coe.GVE()(T[0:2], X)))
+
+        Xdot = coe.ZonalGravity(order=6)(T, coe_sltn)
+        Xdot_lookup = coe.ZonalGravity(order=6, trig_lookup=True)(T, coe_sltn)
+
+        np.testing.assert_allclose(Xdot_lookup, Xdot, rtol=0,
+                                   atol=1e-6*np.max(np.abs(Xdot)))
+
     def test_compare_zonal_to_rv(self):
         X0_coe = coe_0
         X0_rv = rv_0
@@ -711,6 +857,29 @@ class TestMEEMl0(unittest.TestCase):
             convert.rv_mee(convert.mee_meeMl0(T, X_meeMl0)),
             rtol=0, atol=tol*10)
 
+    def test_constant_thrust_ensemble(self):
+        X = np.stack((
+            convert.meeMl0_coe(T, coe_sltn),
+            convert.meeMl0_coe(T, coe.KeplerianSolution(coe_0 * 1.1)(T))))
+        u = np.array([[1e-6, 1e-6, 1e-6]])
+
+        conthrust = meeMl0.ConstantThrust(u)
+        Xdot = conthrust(T, X)
+
+        self.assertEqual(Xdot.shape, (2, m, 6))
+        for Xdot_k, X_k in zip(Xdot, X):
+            np.testing.assert_allclose(Xdot_k, conthrust(T, X_k), rtol=0,
+                                       atol=tol)
+
+    def test_constant_thrust_backend_xp(self):
+        X = convert.meeMl0_coe(T, coe_sltn)
+        u = (1e-6, 1e-6, 1e-6)
+
+        Xdot = meeMl0.ConstantThrust(np.array([u]))(T, X)
+        Xdot_xp = meeMl0.constant_thrust._constant_thrust_xp(np, T, X, u, mu)
+
+        np.testing.assert_allclose(Xdot_xp, Xdot, rtol=0, atol=tol)
+
     def test_compare_zonal_to_mee(self):
         X0_meeMl0 = meeMl0_0
         X0_mee = mee_0
@@ -952,6 +1121,16 @@ class TestConvert(unittest.TestCase):
 
         np.testing.assert_allclose(diff, 0., rtol=0, atol=tol)
 
+    def test_meeMl_meeEl_meeMl_high_eccentricity(self):
+        coeM = np.tile(coe_0, (m, 1))
+        coeM[:, 1] = np.linspace(0., .95, num=m)
+        coeM[:, 5] = np.linspace(0., 20*np.pi, num=m)
+        meeMl = convert.mee_coe(coeM)
+        meeMl2 = convert.meeMl_meeEl(convert.meeEl_meeMl(meeMl))
+        diff = np.mod(meeMl2[:, 5] - meeMl[:, 5] + np.pi, 2*np.pi) - np.pi
+
+        np.testing.assert_allclose(diff, 0., rtol=0, atol=tol*100)
+
     def test_meeEl_meefl_meeEl(self):
         meeEl = convert.mod_angles(convert.mee_coe(coe_sltn))
         meefl = convert.meefl_meeEl(meeEl)
@@ -1112,6 +1291,22 @@ class TestConvert(unittest.TestCase):
 
         np.testing.assert_allclose(diff, 0., rtol=0, atol=tol*10)
 
+    def test_meeMl0_circular_matches_numpy(self):
+        T = np.zeros(2)
+        coe = np.array([[a_0, 0., i_0, W_0, w_0, f_0],
+                        [a_0, 0., 0., W_0, w_0, f_0]])
+        meeMl0 = np.array([[a_0, 0., 0., .1, .2, .3]])
+
+        for name, X in (('meeMl0_coe', coe), ('rv_meeMl0', meeMl0)):
+            module = importlib.import_module('orbital_elements.convert.' +
+                                             name)
+            conversion = getattr(module, name)
+            Y = conversion(T[0:X.shape[0]], X)
+            with unittest.mock.patch.object(module, 'HAVE_NUMBA', False):
+                Y_np = conversion(T[0:X.shape[0]], X)
+
+            np.testing.assert_allclose(Y, Y_np, rtol=tol)
+
     def test_rv_meeMl0_rv(self):
         T = np.linspace(0, 10, num=m)
         rv = convert.rv_coe(coe_sltn)
@@ -1123,6 +1318,14 @@ class TestConvert(unittest.TestCase):
 
         np.testing.assert_allclose(diff, 0., rtol=0, atol=tol)
 
+    def test_soa_rv_coe(self):
+        columns = convert.to_soa(coe_sltn)
+        rv = convert.from_soa(rv_coe_soa(columns))
+
+        np.testing.assert_array_equal(convert.from_soa(columns), coe_sltn)
+        np.testing.assert_allclose(rv, convert.rv_coe(coe_sltn), rtol=0,
+                                   atol=tol)
+
 
 class TestUtilities(unittest.TestCase):
 
@@ -1135,6 +1338,19 @@ class TestUtilities(unittest.TestCase):
 
         self.assertEqual(y, 20)
 
+    def test_propagate_ensemble(self):
+        T = np.linspace(0, period, num=11)
+        X0 = np.concatenate((rv_0, rv_0 * 1.1))
+
+        X = parallel.propagate_ensemble(rv.KeplerianDynamics, T, X0,
+                                        n_workers=2)
+
+        self.assertEqual(X.shape, (2, 11, 6))
+        for X_k, X0_k in zip(X, X0):
+            X_sol = rv.KeplerianSolution(X0_k.reshape((1, 6)))(
+                T.reshape((11, 1)))
+            np.testing.assert_allclose(X_k, X_sol, rtol=0, atol=1e-10)
+
     def test_secant_method_scalar(self):
         (X, e, n) = utl.secant_method(np.sin, np.pi/3, np.pi/4)
         x0 = X[-1]